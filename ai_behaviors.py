@@ -3,15 +3,20 @@ Death Circuit - AI Behavior System
 Handles intelligent enemy decision-making, pathfinding, and combat tactics
 """
 
-import pygame
 import math
 import random
+from collections import deque
+from itertools import islice
 from typing import List, Tuple, Optional, Dict, Any
-from utils import distance, angle_to, normalize_vector, vector_from_angle, predict_intercept, wrap_angle, line_of_sight
+from utils import distance, dist_sq, angle_to, normalize_vector, vector_from_angle, predict_intercept, wrap_angle
 from collision import CollisionManager
 import config
 
 
+# Scale that normalizes DodgerAI's 0.7 forward + 0.3 strafe movement blend
+DODGER_STRAFE_NORMALIZE = 1.0 / math.sqrt(0.7 * 0.7 + 0.3 * 0.3)
+
+
 class AIState:
     """AI state enumeration"""
     PATROL = 0
@@ -33,16 +38,55 @@ class AIDecision:
         self.priority = 0
 
 
+class PlayerTracker:
+    """Recent player velocities for movement prediction, recorded once per
+    frame and shared by every AI that holds the tracker"""
+    
+    def __init__(self, memory_duration: float = 2.0):
+        # One sample per frame (the deque drops the oldest when full)
+        self.velocities = deque(maxlen=int(memory_duration * config.FPS))
+        self._weighted_velocity = None
+    
+    def record(self, player):
+        """Add the player's current velocity to memory"""
+        velocity = player.velocity
+        self.velocities.append((velocity[0], velocity[1]))
+        self._weighted_velocity = None
+    
+    def get_weighted_velocity(self) -> Optional[Tuple[float, float]]:
+        """Recency-weighted average of the last 10 velocities, computed at most
+        once per recorded frame; None until there are two samples"""
+        if self._weighted_velocity is None:
+            memory = self.velocities
+            if len(memory) < 2:
+                return None
+            
+            # Weight recent velocities more heavily, newest first
+            weighted_x = weighted_y = total_weight = 0.0
+            sample_count = min(len(memory), 10)
+            for age, (velocity_x, velocity_y) in enumerate(islice(reversed(memory), sample_count)):
+                # More recent = higher weight
+                weight = (sample_count - age) / sample_count
+                weighted_x += velocity_x * weight
+                weighted_y += velocity_y * weight
+                total_weight += weight
+            
+            self._weighted_velocity = (weighted_x / total_weight, weighted_y / total_weight)
+        return self._weighted_velocity
+
+
 class AIBehavior:
     """Base AI behavior class"""
     
-    def __init__(self, entity, collision_manager: CollisionManager):
+    def __init__(self, entity, collision_manager: CollisionManager,
+                 player_tracker: Optional[PlayerTracker] = None):
         self.entity = entity
         self.collision_manager = collision_manager
         self.state = AIState.PATROL
         self.target_player = None
         self.last_seen_player_pos = None
         self.last_seen_time = 0
+        self._now = 0.0  # Seconds of game time seen by this AI, advanced by dt
         self.state_timer = 0
         self.decision_cooldown = 0
         self.pathfinding_target = None
@@ -50,45 +94,43 @@ class AIBehavior:
         self.dodge_cooldown = 0
         self.aggro_cooldown = 0
         
-        # Memory for player movement prediction
-        self.player_velocity_memory = []
+        # Entity-to-player vector, distance and visibility, sensed once per
+        # decision and shared by _make_decision and _execute_decision
+        self.player_dx = 0.0
+        self.player_dy = 0.0
+        self.player_dist_sq = 0.0
+        self.player_visible = False
+        
+        # Memory for player movement prediction. A shared tracker is recorded
+        # by its owner (the enemy spawner), otherwise this AI records its own
         self.memory_duration = 2.0  # seconds
+        self._owns_tracker = player_tracker is None
+        self.player_tracker = player_tracker or PlayerTracker(self.memory_duration)
     
     def update(self, dt: float, player, all_entities: List):
         """Update AI behavior"""
+        # Dead entities make no decisions
+        if self.state == AIState.DEAD:
+            return
+        
         self.target_player = player
+        self._now += dt
         self.decision_cooldown -= dt
         self.state_timer -= dt
         self.dodge_cooldown -= dt
         self.aggro_cooldown -= dt
         
         # Update player memory
-        self._update_player_memory(player, dt)
+        if self._owns_tracker:
+            self.player_tracker.record(player)
         
         # Make decisions at AI update rate
         if self.decision_cooldown <= 0:
+            self._sense_player()
             decision = self._make_decision(all_entities)
             self._execute_decision(decision, dt)
             self.decision_cooldown = 1.0 / config.AI_UPDATE_RATE
     
-    def _update_player_memory(self, player, dt: float):
-        """Update memory of player movement for prediction"""
-        current_time = pygame.time.get_ticks() / 1000.0
-        
-        # Add current player state to memory
-        if hasattr(player, 'velocity'):
-            self.player_velocity_memory.append({
-                'time': current_time,
-                'pos': player.pos,
-                'velocity': player.velocity
-            })
-        
-        # Remove old memory
-        self.player_velocity_memory = [
-            mem for mem in self.player_velocity_memory
-            if current_time - mem['time'] < self.memory_duration
-        ]
-    
     def _make_decision(self, all_entities: List) -> AIDecision:
         """Make AI decision - to be overridden by subclasses"""
         decision = AIDecision()
@@ -112,18 +154,29 @@ class AIBehavior:
         # Set look direction
         self.entity.look_direction = decision.look_direction
     
-    def _can_see_player(self) -> bool:
-        """Check if AI can see the player"""
+    def _sense_player(self):
+        """Compute the vector, squared distance and visibility to the player"""
         if not self.target_player:
-            return False
-        
-        dist = distance(self.entity.pos, self.target_player.pos)
-        if dist > self.entity.detection_range:
-            return False
-        
-        # Check line of sight
-        return line_of_sight(self.entity.pos, self.target_player.pos, 
-                           self.collision_manager.walls)
+            self.player_visible = False
+            return
+        
+        player_pos = self.target_player.pos
+        dx = player_pos[0] - self.entity.pos[0]
+        dy = player_pos[1] - self.entity.pos[1]
+        self.player_dx = dx
+        self.player_dy = dy
+        self.player_dist_sq = dx * dx + dy * dy
+        
+        # Range check first, then line of sight
+        detection_range = self.entity.detection_range
+        self.player_visible = (
+            self.player_dist_sq <= detection_range * detection_range and
+            self.collision_manager.has_line_of_sight(self.entity.pos, player_pos)
+        )
+    
+    def _can_see_player(self) -> bool:
+        """Check if AI can see the player (as of the last sensing pass)"""
+        return self.player_visible
     
     def _get_predicted_player_position(self, prediction_time: float) -> Tuple[float, float]:
         """Predict where player will be in the future using velocity tracking"""
@@ -135,26 +188,12 @@ class AIBehavior:
             return self.target_player.pos
         
         # Use recent player velocity for prediction with weighted average
-        if self.player_velocity_memory and len(self.player_velocity_memory) >= 2:
-            # Weight recent velocities more heavily (exponential moving average)
-            weighted_velocity = [0.0, 0.0]
-            total_weight = 0.0
-            
-            recent_memories = self.player_velocity_memory[-10:]  # Last 10 entries
-            for i, mem in enumerate(recent_memories):
-                # More recent = higher weight
-                weight = (i + 1) / len(recent_memories)
-                weighted_velocity[0] += mem['velocity'][0] * weight
-                weighted_velocity[1] += mem['velocity'][1] * weight
-                total_weight += weight
-            
-            if total_weight > 0:
-                weighted_velocity[0] /= total_weight
-                weighted_velocity[1] /= total_weight
-            
+        weighted_velocity = self.player_tracker.get_weighted_velocity()
+        if weighted_velocity is not None:
             # Calculate bullet travel time to target
             dist = distance(self.entity.pos, self.target_player.pos)
-            bullet_speed = getattr(self.entity.weapon, 'bullet_speed', 600) if hasattr(self.entity, 'weapon') else 600
+            weapon = self.entity.weapon
+            bullet_speed = weapon.bullet_speed if weapon else 600
             travel_time = dist / bullet_speed if bullet_speed > 0 else prediction_time
             
             # Use travel time for more accurate prediction
@@ -163,7 +202,7 @@ class AIBehavior:
             # Apply prediction accuracy factor (adds some error)
             accuracy_factor = config.AI_PREDICTION_ACCURACY
             # Boss enemies get perfect prediction
-            if hasattr(self.entity, 'is_boss') and self.entity.is_boss:
+            if self.entity.is_boss:
                 accuracy_factor = 1.0
             
             # Add random error based on accuracy
@@ -187,25 +226,34 @@ class AIBehavior:
         """Detect bullets heading towards this entity"""
         incoming_bullets = []
         
-        if hasattr(self.entity, 'game'):
-            for bullet in self.entity.game.bullet_manager.bullets:
-                if bullet.owner_id != self.entity.id and bullet.alive:
-                    # Check if bullet is heading towards entity
-                    bullet_to_entity = (
-                        self.entity.pos[0] - bullet.pos[0],
-                        self.entity.pos[1] - bullet.pos[1]
-                    )
-                    bullet_direction = normalize_vector(bullet.velocity)
-                    entity_direction = normalize_vector(bullet_to_entity)
-                    
-                    # Check if bullet is moving towards entity
-                    dot_product = (bullet_direction[0] * entity_direction[0] + 
-                                 bullet_direction[1] * entity_direction[1])
-                    
-                    if dot_product > 0.7:  # Bullet is heading towards entity
-                        dist = distance(bullet.pos, self.entity.pos)
-                        if dist < config.DODGER_BULLET_DODGE_RADIUS:
-                            incoming_bullets.append(bullet.velocity)
+        game = self.entity.game
+        if game:
+            dodge_radius = config.DODGER_BULLET_DODGE_RADIUS
+            dodge_radius_sq = dodge_radius * dodge_radius
+            entity_x, entity_y = self.entity.pos
+            entity_id = self.entity.owner_int_id
+            
+            # Only bullets in the neighboring grid cells can be close enough
+            nearby_bullets = game.bullet_manager.get_bullets_near(
+                self.entity.pos, dodge_radius)
+            
+            for bullet in nearby_bullets:
+                if bullet.owner_id == entity_id:
+                    continue
+                
+                # Vector from bullet to entity
+                dx = entity_x - bullet.pos[0]
+                dy = entity_y - bullet.pos[1]
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= dodge_radius_sq:
+                    continue
+                
+                # Bullet is heading towards entity if the cosine between its
+                # velocity and the bullet-to-entity vector exceeds 0.7
+                vx, vy = bullet.velocity
+                dot = vx * dx + vy * dy
+                if dot > 0 and dot * dot > 0.49 * (vx * vx + vy * vy) * dist_sq:
+                    incoming_bullets.append(bullet.velocity)
         
         return incoming_bullets
 
@@ -213,10 +261,12 @@ class AIBehavior:
 class RusherAI(AIBehavior):
     """Rusher AI - Charges directly at player"""
     
-    def __init__(self, entity, collision_manager: CollisionManager):
-        super().__init__(entity, collision_manager)
+    def __init__(self, entity, collision_manager: CollisionManager,
+                 player_tracker: Optional[PlayerTracker] = None):
+        super().__init__(entity, collision_manager, player_tracker)
         self.entity.detection_range = 800  # Increased from 400
         self.charge_speed = config.RUSHER_SPEED
+        self._attack_range_sq = config.RUSHER_ATTACK_RANGE ** 2
     
     def _make_decision(self, all_entities: List) -> AIDecision:
         decision = AIDecision()
@@ -225,12 +275,13 @@ class RusherAI(AIBehavior):
             decision.state = AIState.PATROL
             return decision
         
-        player_distance = distance(self.entity.pos, self.target_player.pos)
-        can_see_player = self._can_see_player()
+        entity_pos = self.entity.pos
+        player_distance_sq = self.player_dist_sq
+        can_see_player = self.player_visible
         
         if can_see_player:
             self.last_seen_player_pos = self.target_player.pos
-            self.last_seen_time = pygame.time.get_ticks() / 1000.0
+            self.last_seen_time = self._now
         
         # Always track player position even if can't see them
         if not self.last_seen_player_pos:
@@ -240,7 +291,7 @@ class RusherAI(AIBehavior):
         target_pos = self.target_player.pos if can_see_player else self.last_seen_player_pos
         
         # State transitions - always engage
-        if player_distance < config.RUSHER_ATTACK_RANGE and can_see_player:
+        if player_distance_sq < self._attack_range_sq and can_see_player:
             decision.state = AIState.ATTACK
         else:
             # Always chase the player (or last known position)
@@ -251,19 +302,15 @@ class RusherAI(AIBehavior):
             # Move directly towards player
             if target_pos:
                 direction = normalize_vector((
-                    target_pos[0] - self.entity.pos[0],
-                    target_pos[1] - self.entity.pos[1]
+                    target_pos[0] - entity_pos[0],
+                    target_pos[1] - entity_pos[1]
                 ))
                 decision.move_direction = direction
                 
                 # Use predictive aiming when shooting
                 if can_see_player:
                     predicted_pos = self._get_predicted_player_position(config.RUSHER_PREDICTION_TIME)
-                    direction_to_predicted = normalize_vector((
-                        predicted_pos[0] - self.entity.pos[0],
-                        predicted_pos[1] - self.entity.pos[1]
-                    ))
-                    decision.look_direction = math.atan2(direction_to_predicted[1], direction_to_predicted[0])
+                    decision.look_direction = angle_to(entity_pos, predicted_pos)
                 else:
                     decision.look_direction = math.atan2(direction[1], direction[0])
                 
@@ -279,12 +326,19 @@ class RusherAI(AIBehavior):
 class SniperAI(AIBehavior):
     """Sniper AI - Maintains distance and fires accurately"""
     
-    def __init__(self, entity, collision_manager: CollisionManager):
-        super().__init__(entity, collision_manager)
+    def __init__(self, entity, collision_manager: CollisionManager,
+                 player_tracker: Optional[PlayerTracker] = None):
+        super().__init__(entity, collision_manager, player_tracker)
         self.entity.detection_range = 900  # Increased from 600
         self.preferred_range = config.SNIPER_PREFERRED_RANGE
         self.retreat_range = config.SNIPER_RETREAT_RANGE
         self.shot_prepare_timer = 0
+        
+        # Squared range thresholds for sqrt-free distance checks
+        self._preferred_range_sq = self.preferred_range ** 2
+        self._retreat_range_sq = self.retreat_range ** 2
+        self._attack_band_min_sq = (self.preferred_range - 50) ** 2
+        self._attack_band_max_sq = (self.preferred_range + 50) ** 2
     
     def _make_decision(self, all_entities: List) -> AIDecision:
         decision = AIDecision()
@@ -293,12 +347,13 @@ class SniperAI(AIBehavior):
             decision.state = AIState.PATROL
             return decision
         
-        player_distance = distance(self.entity.pos, self.target_player.pos)
-        can_see_player = self._can_see_player()
+        entity_pos = self.entity.pos
+        player_distance_sq = self.player_dist_sq
+        can_see_player = self.player_visible
         
         if can_see_player:
             self.last_seen_player_pos = self.target_player.pos
-            self.last_seen_time = pygame.time.get_ticks() / 1000.0
+            self.last_seen_time = self._now
         
         # Always track player position even if can't see them
         if not self.last_seen_player_pos:
@@ -308,10 +363,10 @@ class SniperAI(AIBehavior):
         target_pos = self.target_player.pos if can_see_player else self.last_seen_player_pos
         
         # State transitions - snipers always maintain position relative to player
-        if player_distance < self.retreat_range:
+        if player_distance_sq < self._retreat_range_sq:
             decision.state = AIState.RETREAT
-        elif (player_distance > self.preferred_range - 50 and 
-              player_distance < self.preferred_range + 50):
+        elif (player_distance_sq > self._attack_band_min_sq and 
+              player_distance_sq < self._attack_band_max_sq):
             decision.state = AIState.ATTACK
         else:
             # Move towards preferred range
@@ -322,22 +377,22 @@ class SniperAI(AIBehavior):
             # Move away from player
             if target_pos:
                 direction = normalize_vector((
-                    self.entity.pos[0] - target_pos[0],
-                    self.entity.pos[1] - target_pos[1]
+                    entity_pos[0] - target_pos[0],
+                    entity_pos[1] - target_pos[1]
                 ))
                 decision.move_direction = direction
-                decision.look_direction = math.atan2(-direction[1], -direction[0])
+                decision.look_direction = angle_to(entity_pos, target_pos)
         
         elif decision.state == AIState.CHASE:
             # Move to preferred range
             if target_pos:
                 direction_to_player = normalize_vector((
-                    target_pos[0] - self.entity.pos[0],
-                    target_pos[1] - self.entity.pos[1]
+                    target_pos[0] - entity_pos[0],
+                    target_pos[1] - entity_pos[1]
                 ))
                 
                 # Move towards player but stop at preferred range
-                if player_distance > self.preferred_range:
+                if player_distance_sq > self._preferred_range_sq:
                     decision.move_direction = direction_to_player
                 
                 decision.look_direction = math.atan2(direction_to_player[1], direction_to_player[0])
@@ -347,12 +402,7 @@ class SniperAI(AIBehavior):
             if target_pos:
                 # Predict player movement for leading shots
                 predicted_pos = self._get_predicted_player_position(config.SNIPER_PREDICTION_TIME)
-                direction_to_predicted = normalize_vector((
-                    predicted_pos[0] - self.entity.pos[0],
-                    predicted_pos[1] - self.entity.pos[1]
-                ))
-                
-                decision.look_direction = math.atan2(direction_to_predicted[1], direction_to_predicted[0])
+                decision.look_direction = angle_to(entity_pos, predicted_pos)
         
         # Fire when in ATTACK state or RETREAT state (backing away while shooting)
         if (decision.state == AIState.ATTACK or decision.state == AIState.RETREAT) and can_see_player:
@@ -364,13 +414,15 @@ class SniperAI(AIBehavior):
 class DodgerAI(AIBehavior):
     """Dodger AI - Strafes and dodges bullets"""
     
-    def __init__(self, entity, collision_manager: CollisionManager):
-        super().__init__(entity, collision_manager)
+    def __init__(self, entity, collision_manager: CollisionManager,
+                 player_tracker: Optional[PlayerTracker] = None):
+        super().__init__(entity, collision_manager, player_tracker)
         self.entity.detection_range = 700  # Increased from 350
         self.dodge_cooldown = 0
         self.strafe_direction = 1  # 1 for right, -1 for left
         self.strafe_timer = 0
         self.dash_cooldown = 0
+        self._attack_range_sq = 200 ** 2
     
     def _make_decision(self, all_entities: List) -> AIDecision:
         decision = AIDecision()
@@ -379,13 +431,14 @@ class DodgerAI(AIBehavior):
             decision.state = AIState.PATROL
             return decision
         
-        player_distance = distance(self.entity.pos, self.target_player.pos)
-        can_see_player = self._can_see_player()
+        entity_pos = self.entity.pos
+        player_distance_sq = self.player_dist_sq
+        can_see_player = self.player_visible
         incoming_bullets = self._detect_incoming_bullets()
         
         if can_see_player:
             self.last_seen_player_pos = self.target_player.pos
-            self.last_seen_time = pygame.time.get_ticks() / 1000.0
+            self.last_seen_time = self._now
         
         # Always track player position even if can't see them
         if not self.last_seen_player_pos:
@@ -397,7 +450,7 @@ class DodgerAI(AIBehavior):
         # Check for dodge (highest priority)
         if incoming_bullets and self.dodge_cooldown <= 0:
             decision.state = AIState.DODGE
-        elif player_distance < 200:
+        elif player_distance_sq < self._attack_range_sq:
             decision.state = AIState.ATTACK
         else:
             # Always chase the player
@@ -426,10 +479,12 @@ class DodgerAI(AIBehavior):
         elif decision.state == AIState.CHASE or decision.state == AIState.ATTACK:
             if target_pos:
                 # Move towards player but strafe
-                direction_to_player = normalize_vector((
-                    target_pos[0] - self.entity.pos[0],
-                    target_pos[1] - self.entity.pos[1]
-                ))
+                dx = target_pos[0] - entity_pos[0]
+                dy = target_pos[1] - entity_pos[1]
+                length = math.sqrt(dx * dx + dy * dy)
+                inv_length = 1.0 / length if length > 0 else 0.0
+                forward_x = dx * inv_length
+                forward_y = dy * inv_length
                 
                 # Update strafe direction periodically
                 self.strafe_timer -= 1/60.0  # Assuming 60 FPS
@@ -437,28 +492,25 @@ class DodgerAI(AIBehavior):
                     self.strafe_direction *= -1
                     self.strafe_timer = random.uniform(1.0, 3.0)
                 
-                # Calculate strafe direction (perpendicular to player direction)
-                strafe_direction = normalize_vector((-direction_to_player[1] * self.strafe_direction,
-                                                   direction_to_player[0] * self.strafe_direction))
+                # Strafe direction is perpendicular to the unit forward vector,
+                # so it is already unit length
+                strafe_x = -forward_y * self.strafe_direction
+                strafe_y = forward_x * self.strafe_direction
                 
-                # Combine forward and strafe movement
-                combined_direction = normalize_vector((
-                    direction_to_player[0] * 0.7 + strafe_direction[0] * 0.3,
-                    direction_to_player[1] * 0.7 + strafe_direction[1] * 0.3
-                ))
-                
-                decision.move_direction = combined_direction
+                # Combine forward and strafe movement. The two parts are
+                # orthogonal unit vectors, so the sum always has length
+                # sqrt(0.7^2 + 0.3^2) and normalizing is a constant scale.
+                decision.move_direction = (
+                    (forward_x * 0.7 + strafe_x * 0.3) * DODGER_STRAFE_NORMALIZE,
+                    (forward_y * 0.7 + strafe_y * 0.3) * DODGER_STRAFE_NORMALIZE
+                )
                 
                 # Use predictive aiming when shooting
                 if can_see_player:
                     predicted_pos = self._get_predicted_player_position(config.DODGER_PREDICTION_TIME)
-                    direction_to_predicted = normalize_vector((
-                        predicted_pos[0] - self.entity.pos[0],
-                        predicted_pos[1] - self.entity.pos[1]
-                    ))
-                    decision.look_direction = math.atan2(direction_to_predicted[1], direction_to_predicted[0])
+                    decision.look_direction = angle_to(entity_pos, predicted_pos)
                 else:
-                    decision.look_direction = math.atan2(direction_to_player[1], direction_to_player[0])
+                    decision.look_direction = math.atan2(dy, dx)
         
         # Fire when in attack range or chasing and can see player
         if (decision.state == AIState.ATTACK or decision.state == AIState.CHASE) and can_see_player:
@@ -470,12 +522,14 @@ class DodgerAI(AIBehavior):
 class FlankerAI(AIBehavior):
     """Flanker AI - Tries to attack from sides/back"""
     
-    def __init__(self, entity, collision_manager: CollisionManager):
-        super().__init__(entity, collision_manager)
+    def __init__(self, entity, collision_manager: CollisionManager,
+                 player_tracker: Optional[PlayerTracker] = None):
+        super().__init__(entity, collision_manager, player_tracker)
         self.entity.detection_range = 800  # Increased from 500
         self.flank_angle = math.radians(config.FLANKER_FLANK_ANGLE)
         self.flank_position = None
         self.path_update_timer = 0
+        self._engage_range_sq = 300 ** 2
     
     def _make_decision(self, all_entities: List) -> AIDecision:
         decision = AIDecision()
@@ -484,12 +538,13 @@ class FlankerAI(AIBehavior):
             decision.state = AIState.PATROL
             return decision
         
-        player_distance = distance(self.entity.pos, self.target_player.pos)
-        can_see_player = self._can_see_player()
+        entity_pos = self.entity.pos
+        player_distance_sq = self.player_dist_sq
+        can_see_player = self.player_visible
         
         if can_see_player:
             self.last_seen_player_pos = self.target_player.pos
-            self.last_seen_time = pygame.time.get_ticks() / 1000.0
+            self.last_seen_time = self._now
         
         # Always track player position even if can't see them
         if not self.last_seen_player_pos:
@@ -502,7 +557,7 @@ class FlankerAI(AIBehavior):
             self.path_update_timer = 2.0
         
         # State transitions - flankers always try to get to flanking position
-        if self.flank_position and player_distance < 300:
+        if self.flank_position and player_distance_sq < self._engage_range_sq:
             # Check if we're in good flanking position
             if self._is_good_flanking_position():
                 decision.state = AIState.ATTACK
@@ -516,8 +571,8 @@ class FlankerAI(AIBehavior):
         if decision.state == AIState.CHASE and self.flank_position:
             # Move to flank position
             direction = normalize_vector((
-                self.flank_position[0] - self.entity.pos[0],
-                self.flank_position[1] - self.entity.pos[1]
+                self.flank_position[0] - entity_pos[0],
+                self.flank_position[1] - entity_pos[1]
             ))
             decision.move_direction = direction
             decision.look_direction = math.atan2(direction[1], direction[0])
@@ -527,17 +582,9 @@ class FlankerAI(AIBehavior):
             # Aim at player from flanking position with prediction
             if can_see_player:
                 predicted_pos = self._get_predicted_player_position(config.FLANKER_PREDICTION_TIME)
-                direction_to_predicted = normalize_vector((
-                    predicted_pos[0] - self.entity.pos[0],
-                    predicted_pos[1] - self.entity.pos[1]
-                ))
-                decision.look_direction = math.atan2(direction_to_predicted[1], direction_to_predicted[0])
+                decision.look_direction = angle_to(entity_pos, predicted_pos)
             else:
-                direction_to_player = normalize_vector((
-                    self.last_seen_player_pos[0] - self.entity.pos[0],
-                    self.last_seen_player_pos[1] - self.entity.pos[1]
-                ))
-                decision.look_direction = math.atan2(direction_to_player[1], direction_to_player[0])
+                decision.look_direction = angle_to(entity_pos, self.last_seen_player_pos)
         
         # Fire when can see player (in both CHASE and ATTACK states)
         if (decision.state == AIState.ATTACK or decision.state == AIState.CHASE) and can_see_player:
@@ -552,30 +599,30 @@ class FlankerAI(AIBehavior):
         
         # Get player facing direction
         player_facing = self.target_player.look_direction
+        facing_cos = math.cos(player_facing)
+        facing_sin = math.sin(player_facing)
         
         # Calculate positions to the sides of player
         flank_distance = 250  # Distance from player for flanking
         
-        # Left flank
-        left_angle = player_facing + math.pi / 2
+        # Left flank (facing + 90 degrees: cos -> -sin, sin -> cos)
         left_pos = (
-            self.last_seen_player_pos[0] + math.cos(left_angle) * flank_distance,
-            self.last_seen_player_pos[1] + math.sin(left_angle) * flank_distance
+            self.last_seen_player_pos[0] - facing_sin * flank_distance,
+            self.last_seen_player_pos[1] + facing_cos * flank_distance
         )
         
-        # Right flank
-        right_angle = player_facing - math.pi / 2
+        # Right flank (facing - 90 degrees: cos -> sin, sin -> -cos)
         right_pos = (
-            self.last_seen_player_pos[0] + math.cos(right_angle) * flank_distance,
-            self.last_seen_player_pos[1] + math.sin(right_angle) * flank_distance
+            self.last_seen_player_pos[0] + facing_sin * flank_distance,
+            self.last_seen_player_pos[1] - facing_cos * flank_distance
         )
         
         # Choose the flank position that's further from current position
         # (to encourage movement around the player)
-        left_dist = distance(self.entity.pos, left_pos)
-        right_dist = distance(self.entity.pos, right_pos)
+        left_dist_sq = dist_sq(self.entity.pos, left_pos)
+        right_dist_sq = dist_sq(self.entity.pos, right_pos)
         
-        chosen_pos = left_pos if left_dist > right_dist else right_pos
+        chosen_pos = left_pos if left_dist_sq > right_dist_sq else right_pos
         
         # Validate position
         if not self.collision_manager.is_position_valid(chosen_pos, self.entity.radius):
@@ -601,14 +648,9 @@ class FlankerAI(AIBehavior):
         
         player_facing = vector_from_angle(self.target_player.look_direction, 1.0)
         
-        # Calculate angle between player facing and direction to AI
+        # Cosine of the angle between player facing and direction to AI
         dot_product = player_facing[0] * player_to_ai[0] + player_facing[1] * player_to_ai[1]
-        angle = math.acos(clamp(dot_product, -1, 1))
         
-        # Good flanking position is roughly 90 degrees to the side
-        return math.pi / 3 < angle < 2 * math.pi / 3
-
-
-def clamp(value: float, min_val: float, max_val: float) -> float:
-    """Clamp a value between min and max"""
-    return max(min_val, min(value, max_val))
\ No newline at end of file
+        # Good flanking position is roughly 90 degrees to the side, i.e. an
+        # angle between 60 and 120 degrees (cos(60) = 0.5, cos(120) = -0.5)
+        return -0.5 < dot_product < 0.5
\ No newline at end of file
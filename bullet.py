@@ -5,25 +5,86 @@ Handles bullet physics, collision, and rendering
 
 import pygame
 import math
+from collections import deque
 from typing import Tuple, Optional, List
-from utils import normalize_vector, distance
+from utils import normalize_vector, distance, dist_sq, to_display_format
 import config
 
 
+# Pre-rendered glow sprites keyed by (color, radius, alpha bucket)
+_GLOW_CACHE = {}
+GLOW_ALPHA_LEVELS = 8
+
+# Bullets outside these bounds are culled
+CULL_MIN_X = -config.BULLET_CULL_DISTANCE
+CULL_MAX_X = config.SCREEN_WIDTH + config.BULLET_CULL_DISTANCE
+CULL_MIN_Y = -config.BULLET_CULL_DISTANCE
+CULL_MAX_Y = config.SCREEN_HEIGHT + config.BULLET_CULL_DISTANCE
+
+# Bullet grid cells are keyed by the single int cell_x * stride + cell_y,
+# which is unique while |cell_y| stays below half the stride
+BULLET_GRID_KEY_STRIDE = 1 << 16
+
+
+def get_glow_surface(color: Tuple[int, int, int], radius: int, alpha_bucket: int) -> pygame.Surface:
+    """Get a cached glow sprite, rendering it on first use"""
+    key = (color, radius, alpha_bucket)
+    glow_surface = _GLOW_CACHE.get(key)
+    if glow_surface is None:
+        glow_alpha = 100 * alpha_bucket // (GLOW_ALPHA_LEVELS - 1)
+        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surface, (*color, glow_alpha), (radius * 2, radius * 2), radius * 2)
+        glow_surface = to_display_format(glow_surface)
+        _GLOW_CACHE[key] = glow_surface
+    return glow_surface
+
+
+class OwnerRegistry:
+    """Maps entity id strings to small integer owner ids for bullets"""
+    
+    _ids = {}
+    _names = []
+    
+    @classmethod
+    def register(cls, name: str) -> int:
+        """Get the integer id for an entity name, assigning one on first use"""
+        owner_id = cls._ids.get(name)
+        if owner_id is None:
+            owner_id = len(cls._names)
+            cls._ids[name] = owner_id
+            cls._names.append(name)
+        return owner_id
+    
+    @classmethod
+    def lookup(cls, name: str) -> Optional[int]:
+        """Get the integer id for an entity name without registering it"""
+        return cls._ids.get(name)
+    
+    @classmethod
+    def name_of(cls, owner_id: int) -> str:
+        """Get the entity name for an integer owner id"""
+        return cls._names[owner_id]
+
+
 class Bullet:
     """Represents a single bullet projectile"""
     
+    __slots__ = ('pos', 'velocity', 'damage', 'owner_id', 'color', 'radius',
+                 'lifetime', 'max_lifetime', 'trail_positions', 'alive',
+                 'birth_time', 'max_range')
+    
     def __init__(self, pos: Tuple[float, float] = (0, 0), velocity: Tuple[float, float] = (0, 0),
                  damage: int = 0, owner_id: str = "", color: Tuple[int, int, int] = config.BULLET_COLOR):
         self.pos = list(pos)
         self.velocity = list(velocity)
         self.damage = damage
-        self.owner_id = owner_id
+        self.owner_id = OwnerRegistry.register(owner_id)  # Integer owner id
         self.color = color
         self.radius = config.BULLET_SIZE
         self.lifetime = config.BULLET_LIFETIME
         self.max_lifetime = config.BULLET_LIFETIME
-        self.trail_positions = []
+        # Fixed-size ring buffer: appending past maxlen drops the oldest point
+        self.trail_positions = deque(maxlen=config.BULLET_TRAIL_LENGTH)
         self.alive = True
         self.birth_time = 0  # Track creation time for culling
         
@@ -37,11 +98,11 @@ class Bullet:
         self.pos = list(pos)
         self.velocity = list(velocity)
         self.damage = damage
-        self.owner_id = owner_id
+        self.owner_id = OwnerRegistry.register(owner_id)
         self.color = color
         self.lifetime = config.BULLET_LIFETIME
         self.max_lifetime = config.BULLET_LIFETIME
-        self.trail_positions = []
+        self.trail_positions.clear()
         self.alive = True
         self.birth_time = current_time
         
@@ -49,67 +110,39 @@ class Bullet:
         speed = math.sqrt(velocity[0]**2 + velocity[1]**2)
         self.max_range = speed * config.BULLET_LIFETIME
     
-    def update(self, dt: float):
-        """Update bullet position and lifetime"""
-        if not self.alive:
-            return
-        
-        # Store trail position (limit trail length for performance)
-        if len(self.trail_positions) < config.BULLET_TRAIL_LENGTH:
-            self.trail_positions.append(tuple(self.pos))
-        else:
-            # Rotate trail positions instead of constantly popping
-            self.trail_positions = self.trail_positions[1:] + [tuple(self.pos)]
-        
-        # Update position
-        self.pos[0] += self.velocity[0] * dt
-        self.pos[1] += self.velocity[1] * dt
+    def draw_trail(self, trail_surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """Draw the bullet trail onto a shared alpha surface, returning the dirty area"""
+        if not self.alive or len(self.trail_positions) < 2:
+            return None
         
-        # Update lifetime
-        self.lifetime -= dt
+        trail_alpha = int(255 * (self.lifetime / self.max_lifetime))
+        trail_color = (*self.color, trail_alpha // 2)
         
-        # Check if bullet should be removed
-        if self.lifetime <= 0:
-            self.alive = False
+        trail_iter = iter(self.trail_positions)
+        start_pos = next(trail_iter)
+        dirty_rect = None
+        for end_pos in trail_iter:
+            line_rect = pygame.draw.line(trail_surface, trail_color, 
+                                         (int(start_pos[0]), int(start_pos[1])),
+                                         (int(end_pos[0]), int(end_pos[1])), 2)
+            dirty_rect = line_rect if dirty_rect is None else dirty_rect.union(line_rect)
+            start_pos = end_pos
         
-        # Check if bullet is out of bounds (with cull distance)
-        cull_dist = config.BULLET_CULL_DISTANCE
-        if (self.pos[0] < -cull_dist or self.pos[0] > config.SCREEN_WIDTH + cull_dist or
-            self.pos[1] < -cull_dist or self.pos[1] > config.SCREEN_HEIGHT + cull_dist):
-            self.alive = False
+        return dirty_rect
     
     def draw(self, screen: pygame.Surface):
-        """Draw bullet and trail"""
+        """Draw bullet body and glow (trails are drawn by BulletManager)"""
         if not self.alive:
             return
         
-        # Draw trail
-        if len(self.trail_positions) > 1:
-            trail_alpha = int(255 * (self.lifetime / self.max_lifetime))
-            trail_color = (*self.color, trail_alpha // 2)
-            
-            for i in range(len(self.trail_positions) - 1):
-                start_pos = self.trail_positions[i]
-                end_pos = self.trail_positions[i + 1]
-                
-                # Create trail surface with alpha
-                trail_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-                pygame.draw.line(trail_surface, trail_color, 
-                               (int(start_pos[0]), int(start_pos[1])),
-                               (int(end_pos[0]), int(end_pos[1])), 2)
-                screen.blit(trail_surface, (0, 0))
-        
         # Draw bullet
         pygame.draw.circle(screen, self.color, 
                          (int(self.pos[0]), int(self.pos[1])), 
                          self.radius)
         
-        # Add glow effect
-        glow_surface = pygame.Surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA)
-        glow_alpha = int(100 * (self.lifetime / self.max_lifetime))
-        glow_color = (*self.color, glow_alpha)
-        pygame.draw.circle(glow_surface, glow_color, 
-                         (self.radius * 2, self.radius * 2), self.radius * 2)
+        # Add glow effect (alpha quantized so the sprite can be cached)
+        alpha_bucket = max(0, int((GLOW_ALPHA_LEVELS - 1) * self.lifetime / self.max_lifetime))
+        glow_surface = get_glow_surface(self.color, self.radius, alpha_bucket)
         screen.blit(glow_surface, 
                    (int(self.pos[0] - self.radius * 2), 
                     int(self.pos[1] - self.radius * 2)))
@@ -117,8 +150,8 @@ class Bullet:
     def check_collision_with_entity(self, entity_pos: Tuple[float, float], 
                                   entity_radius: float) -> bool:
         """Check collision with an entity (circle)"""
-        dist = distance(self.pos, entity_pos)
-        return dist < self.radius + entity_radius
+        radius_sum = self.radius + entity_radius
+        return dist_sq(self.pos, entity_pos) < radius_sum * radius_sum
     
     def check_collision_with_rect(self, rect: pygame.Rect) -> bool:
         """Check collision with a rectangle (wall)"""
@@ -126,9 +159,8 @@ class Bullet:
         closest_x = max(rect.left, min(self.pos[0], rect.right))
         closest_y = max(rect.top, min(self.pos[1], rect.bottom))
         
-        # Calculate distance
-        dist = distance(self.pos, (closest_x, closest_y))
-        return dist < self.radius
+        # Compare squared distance
+        return dist_sq(self.pos, (closest_x, closest_y)) < self.radius * self.radius
     
     def get_impact_position(self) -> Tuple[float, float]:
         """Get the bullet's current position for impact effects"""
@@ -140,8 +172,11 @@ class Bullet:
             return 0
         
         total_distance = 0
-        for i in range(len(self.trail_positions) - 1):
-            total_distance += distance(self.trail_positions[i], self.trail_positions[i + 1])
+        trail_iter = iter(self.trail_positions)
+        prev_pos = next(trail_iter)
+        for pos in trail_iter:
+            total_distance += distance(prev_pos, pos)
+            prev_pos = pos
         
         return total_distance
     
@@ -161,6 +196,16 @@ class BulletManager:
         self.bullet_count = 0
         self.current_time = 0
         
+        # Shared scratch surface for all bullet trails, cleared once per frame
+        self._trail_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._trail_dirty_rect: Optional[pygame.Rect] = None
+        
+        # Uniform grid of bullets for neighborhood queries, rebuilt lazily
+        # at most once per frame
+        self.grid_cell_size = config.DODGER_BULLET_DODGE_RADIUS
+        self._bullet_grid = {}
+        self._bullet_grid_dirty = True
+        
         # Pre-create bullet pool for object pooling
         if config.ENABLE_OBJECT_POOLING:
             for _ in range(config.MAX_BULLETS_ON_SCREEN):
@@ -176,11 +221,12 @@ class BulletManager:
                 self.bullets[0].alive = False
         
         # Check per-entity bullet limit
-        owner_bullet_count = sum(1 for b in self.bullets if b.alive and b.owner_id == owner_id)
+        owner = OwnerRegistry.register(owner_id)
+        owner_bullet_count = sum(1 for b in self.bullets if b.alive and b.owner_id == owner)
         if owner_bullet_count >= config.MAX_BULLETS_PER_ENTITY:
             # Remove oldest bullet from this owner
             for bullet in self.bullets:
-                if bullet.alive and bullet.owner_id == owner_id:
+                if bullet.alive and bullet.owner_id == owner:
                     bullet.alive = False
                     break
         
@@ -196,26 +242,103 @@ class BulletManager:
             self.bullets.append(bullet)
         
         self.bullet_count += 1
+        self._bullet_grid_dirty = True
     
     def update(self, dt: float):
         """Update all bullets and manage pooling"""
         self.current_time += dt
         
-        # Update active bullets
-        for bullet in self.bullets[:]:
-            bullet.update(dt)
+        # Update active bullets in a single pass, compacting survivors into a
+        # new list instead of calling list.remove() for every dead bullet.
+        # Each bullet's position is read once, then trailed, integrated, aged
+        # and culled in one step, since this runs for every bullet every frame.
+        live_bullets = []
+        pool = self.bullet_pool
+        pooling = config.ENABLE_OBJECT_POOLING
+        pool_limit = config.MAX_BULLETS_ON_SCREEN
+        
+        for bullet in self.bullets:
+            if bullet.alive:
+                pos = bullet.pos
+                velocity = bullet.velocity
+                x = pos[0]
+                y = pos[1]
+                bullet.trail_positions.append((x, y))
+                
+                x += velocity[0] * dt
+                y += velocity[1] * dt
+                pos[0] = x
+                pos[1] = y
+                
+                lifetime = bullet.lifetime - dt
+                bullet.lifetime = lifetime
+                
+                if (lifetime > 0 and CULL_MIN_X <= x <= CULL_MAX_X and
+                        CULL_MIN_Y <= y <= CULL_MAX_Y):
+                    live_bullets.append(bullet)
+                    continue
+                
+                bullet.alive = False
             
-            # Return dead bullets to pool
+            if pooling and len(pool) < pool_limit:
+                # Return dead bullets to pool
+                pool.append(bullet)
+        
+        self.bullets = live_bullets
+        self._bullet_grid_dirty = True
+    
+    def _get_visible_bullets(self) -> List[Bullet]:
+        """Get live bullets whose body, glow or trail overlaps the screen"""
+        screen_width = config.SCREEN_WIDTH
+        screen_height = config.SCREEN_HEIGHT
+        visible = []
+        for bullet in self.bullets:
             if not bullet.alive:
-                self.bullets.remove(bullet)
-                if config.ENABLE_OBJECT_POOLING and len(self.bullet_pool) < config.MAX_BULLETS_ON_SCREEN:
-                    self.bullet_pool.append(bullet)
+                continue
+            
+            # Trails are straight, so the box spanning the oldest trail point
+            # and the current position (padded by the glow) covers everything drawn
+            x, y = bullet.pos
+            trail = bullet.trail_positions
+            tail_x, tail_y = trail[0] if trail else (x, y)
+            margin = bullet.radius * 2
+            if x < tail_x:
+                min_x, max_x = x, tail_x
+            else:
+                min_x, max_x = tail_x, x
+            if y < tail_y:
+                min_y, max_y = y, tail_y
+            else:
+                min_y, max_y = tail_y, y
+            
+            if (max_x + margin >= 0 and min_x - margin < screen_width and
+                    max_y + margin >= 0 and min_y - margin < screen_height):
+                visible.append(bullet)
+        
+        return visible
     
     def draw(self, screen: pygame.Surface):
         """Draw all active bullets"""
-        for bullet in self.bullets:
-            if bullet.alive:
-                bullet.draw(screen)
+        visible_bullets = self._get_visible_bullets()
+        trail_surface = self._trail_surface
+        
+        # Only clear the area touched by last frame's trails
+        if self._trail_dirty_rect is not None:
+            trail_surface.fill((0, 0, 0, 0), self._trail_dirty_rect)
+        
+        # Draw every trail into the shared surface, then blit it once
+        dirty_rect = None
+        for bullet in visible_bullets:
+            line_rect = bullet.draw_trail(trail_surface)
+            if line_rect is not None:
+                dirty_rect = line_rect if dirty_rect is None else dirty_rect.union(line_rect)
+        
+        if dirty_rect is not None:
+            screen.blit(trail_surface, dirty_rect, dirty_rect)
+        self._trail_dirty_rect = dirty_rect
+        
+        for bullet in visible_bullets:
+            bullet.draw(screen)
     
     def clear_bullets(self):
         """Remove all bullets and return to pool"""
@@ -226,10 +349,56 @@ class BulletManager:
         
         self.bullets.clear()
         self.bullet_count = 0
+        self._bullet_grid_dirty = True
+    
+    def _rebuild_bullet_grid(self):
+        """Bucket live bullets into grid cells"""
+        grid = {}
+        cell_size = self.grid_cell_size
+        for bullet in self.bullets:
+            if bullet.alive:
+                cell = (int(bullet.pos[0] // cell_size) * BULLET_GRID_KEY_STRIDE +
+                        int(bullet.pos[1] // cell_size))
+                bucket = grid.get(cell)
+                if bucket is None:
+                    grid[cell] = [bullet]
+                else:
+                    bucket.append(bullet)
+        
+        self._bullet_grid = grid
+        self._bullet_grid_dirty = False
+    
+    def get_bullets_near(self, pos: Tuple[float, float], radius: float) -> List[Bullet]:
+        """Get live bullets in the grid cells overlapping a circle (broad phase only)"""
+        if self._bullet_grid_dirty:
+            self._rebuild_bullet_grid()
+        
+        grid = self._bullet_grid
+        if not grid:
+            return []
+        
+        cell_size = self.grid_cell_size
+        min_x = int((pos[0] - radius) // cell_size)
+        max_x = int((pos[0] + radius) // cell_size)
+        min_y = int((pos[1] - radius) // cell_size)
+        max_y = int((pos[1] + radius) // cell_size)
+        
+        nearby = []
+        for cell_x in range(min_x, max_x + 1):
+            column_key = cell_x * BULLET_GRID_KEY_STRIDE
+            for cell_y in range(min_y, max_y + 1):
+                bucket = grid.get(column_key + cell_y)
+                if bucket:
+                    nearby.extend(bullet for bullet in bucket if bullet.alive)
+        
+        return nearby
     
     def get_bullets_by_owner(self, owner_id: str) -> List[Bullet]:
         """Get all bullets owned by a specific entity"""
-        return [bullet for bullet in self.bullets if bullet.alive and bullet.owner_id == owner_id]
+        owner = OwnerRegistry.lookup(owner_id)
+        if owner is None:
+            return []  # No bullet was ever fired by this owner
+        return [bullet for bullet in self.bullets if bullet.alive and bullet.owner_id == owner]
     
     def get_live_bullets(self) -> List[Bullet]:
         """Get all active bullets"""
@@ -239,14 +408,17 @@ class BulletManager:
                               radius: float, owner_filter: Optional[str] = None) -> int:
         """Count bullets within a radius, optionally filtering by owner"""
         count = 0
-        for bullet in self.bullets:
-            if not bullet.alive:
-                continue
-            
-            if owner_filter and bullet.owner_id != owner_filter:
+        radius_sq = radius * radius
+        owner = None
+        if owner_filter:
+            owner = OwnerRegistry.lookup(owner_filter)
+            if owner is None:
+                return 0  # No bullet was ever fired by this owner
+        for bullet in self.get_bullets_near(pos, radius):
+            if owner is not None and bullet.owner_id != owner:
                 continue
             
-            if distance(bullet.pos, pos) <= radius:
+            if dist_sq(bullet.pos, pos) <= radius_sq:
                 count += 1
         
         return count
\ No newline at end of file
@@ -178,7 +178,7 @@ BULLET_CULL_DISTANCE = 150  # Pixels off-screen before deletion
 BULLET_MAX_LIFETIME = 5.0  # Seconds before auto-deletion
 PARTICLE_CULL_DISTANCE = 100  # Pixels off-screen before deletion
 OFF_SCREEN_UPDATE_RATE = 5  # Update off-screen enemies every N frames
-ENABLE_OBJECT_POOLING = True  # Use object pooling for bullets
+ENABLE_OBJECT_POOLING = True  # Use object pooling for bullets and enemies
 ADAPTIVE_QUALITY = True  # Lower quality when FPS drops
 
 # Game States
@@ -274,30 +274,52 @@ KEY_WEAPON_4 = pygame.K_4
 MOUSE_LEFT = 1
 MOUSE_RIGHT = 3
 
+# Active difficulty settings and the multipliers used on hot paths, cached
+# so helpers skip the nested dict lookups (refreshed by set_difficulty)
+_active_settings = DIFFICULTY_SETTINGS[CURRENT_DIFFICULTY]
+_player_health_multiplier = 1.0
+_player_damage_multiplier = 1.0
+_enemy_health_multiplier = 1.0
+_enemy_damage_multiplier = 1.0
+_enemy_speed_multiplier = 1.0
+
+def _cache_difficulty_settings():
+    """Cache the settings and multipliers for the current difficulty"""
+    global _active_settings, _player_health_multiplier, _player_damage_multiplier
+    global _enemy_health_multiplier, _enemy_damage_multiplier, _enemy_speed_multiplier
+    _active_settings = DIFFICULTY_SETTINGS[CURRENT_DIFFICULTY]
+    _player_health_multiplier = _active_settings.get('player_health_multiplier', 1.0)
+    _player_damage_multiplier = _active_settings.get('player_damage_multiplier', 1.0)
+    _enemy_health_multiplier = _active_settings.get('enemy_health_multiplier', 1.0)
+    _enemy_damage_multiplier = _active_settings.get('enemy_damage_multiplier', 1.0)
+    _enemy_speed_multiplier = _active_settings.get('enemy_speed_multiplier', 1.0)
+
+_cache_difficulty_settings()
+
 # Difficulty Helper Functions
 def get_difficulty_setting(key):
     """Get a difficulty setting value for current difficulty"""
-    return DIFFICULTY_SETTINGS[CURRENT_DIFFICULTY].get(key, 1.0)
+    return _active_settings.get(key, 1.0)
 
 def apply_difficulty_to_player_health(base_health):
     """Apply difficulty multiplier to player health"""
-    return int(base_health * get_difficulty_setting('player_health_multiplier'))
+    return int(base_health * _player_health_multiplier)
 
 def apply_difficulty_to_player_damage(base_damage):
     """Apply difficulty multiplier to player damage"""
-    return int(base_damage * get_difficulty_setting('player_damage_multiplier'))
+    return int(base_damage * _player_damage_multiplier)
 
 def apply_difficulty_to_enemy_health(base_health):
     """Apply difficulty multiplier to enemy health"""
-    return int(base_health * get_difficulty_setting('enemy_health_multiplier'))
+    return int(base_health * _enemy_health_multiplier)
 
 def apply_difficulty_to_enemy_damage(base_damage):
     """Apply difficulty multiplier to enemy damage"""
-    return int(base_damage * get_difficulty_setting('enemy_damage_multiplier'))
+    return int(base_damage * _enemy_damage_multiplier)
 
 def apply_difficulty_to_enemy_speed(base_speed):
     """Apply difficulty multiplier to enemy speed"""
-    return base_speed * get_difficulty_setting('enemy_speed_multiplier')
+    return base_speed * _enemy_speed_multiplier
 
 def get_boss_wave_interval():
     """Get boss wave interval based on difficulty"""
@@ -305,12 +327,13 @@ def get_boss_wave_interval():
 
 def get_difficulty_name():
     """Get current difficulty name"""
-    return DIFFICULTY_SETTINGS[CURRENT_DIFFICULTY]['name']
+    return _active_settings['name']
 
 def set_difficulty(difficulty_level):
     """Set the game difficulty"""
     global CURRENT_DIFFICULTY
     if difficulty_level in DIFFICULTY_SETTINGS:
         CURRENT_DIFFICULTY = difficulty_level
+        _cache_difficulty_settings()
         return True
     return False
\ No newline at end of file
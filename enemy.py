@@ -6,24 +6,90 @@ Base enemy class and specific AI personality types
 import pygame
 import math
 import random
-from typing import Tuple, List, Optional
-from ai_behaviors import RusherAI, SniperAI, DodgerAI, FlankerAI, AIState
-from weapon import Pistol, SMG, Shotgun, Rifle
-from bullet import Bullet
+from typing import Tuple, List, Dict, Optional, NamedTuple
+from ai_behaviors import RusherAI, SniperAI, DodgerAI, FlankerAI, AIState, PlayerTracker
+from weapon import Weapon, Pistol, SMG, Shotgun, Rifle
+from bullet import Bullet, OwnerRegistry
 from particle_system import ParticleEmitter
-from utils import normalize_vector, vector_from_angle, distance
+from utils import normalize_vector, vector_from_angle, distance, to_display_format
 import config
 
 
+# Screen bounds for clamping enemy movement
+SCREEN_RIGHT = config.SCREEN_WIDTH
+SCREEN_BOTTOM = config.SCREEN_HEIGHT
+
+# Pre-rendered enemy bodies keyed by (type, is_boss, color, radius, direction step)
+_BODY_CACHE = {}
+
+# The direction indicator is baked into the body sprite at this many angles
+DIRECTION_STEPS = 32
+
+def _boss_shade(color: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Darker, more menacing variant of an enemy color for bosses"""
+    r, g, b = color
+    return (min(255, r + 50), max(0, g - 50), max(0, b - 50))
+
+
+# Boss colors keyed by the base enemy color
+BOSS_COLORS = {color: _boss_shade(color) for color in (
+    config.ENEMY_RUSHER_COLOR, config.ENEMY_SNIPER_COLOR,
+    config.ENEMY_DODGER_COLOR, config.ENEMY_FLANKER_COLOR)}
+
+# Solid health-bar strips keyed by (color, width, height)
+_BAR_CACHE = {}
+
+
+def get_bar_surface(color: Tuple[int, int, int], width: int, height: int) -> pygame.Surface:
+    """Get a cached solid strip for health bars, filling it on first use"""
+    key = (color, width, height)
+    bar_surface = _BAR_CACHE.get(key)
+    if bar_surface is None:
+        bar_surface = pygame.Surface((width, height))
+        bar_surface.fill(color)
+        _BAR_CACHE[key] = bar_surface
+    return bar_surface
+
+
 class Enemy:
     """Base enemy class"""
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('pos', 'velocity', 'radius', 'enemy_type', 'serial', 'id', 'owner_int_id',
+                 'is_boss', 'max_health', 'health', 'detection_range', 'base_damage', 'damage',
+                 'speed', 'base_speed', 'move_direction', '_look_direction',
+                 '_look_cos', '_look_sin', '_look_step', 'ai_behavior', 'weapon', 'bullets',
+                 'bullet_manager', 'particle_emitter', 'game', 'state', 'alive',
+                 'invincible', 'invincibility_timer', '_draw_flash', 'damage_dealt',
+                 'shots_fired', 'color', 'collision_manager')
+    
+    _next_serial = 0  # Last serial handed out; keeps enemy ids unique
+    
     def __init__(self, pos: Tuple[float, float], enemy_type: str):
+        self.enemy_type = enemy_type
+        self.weapon: Optional[Weapon] = None  # Created by the subclass reset
+        self.is_boss = False
+        self.reset(pos)
+    
+    def reset(self, pos: Tuple[float, float]):
+        """Reset enemy for reuse (object pooling)"""
+        # Pooled enemies keep their weapon, except a former boss: the boss
+        # boost scaled its stats, so the subclass builds a fresh one
+        if self.weapon is not None:
+            if self.is_boss:
+                self.weapon = None
+            else:
+                self.weapon.reset()
+        
         self.pos = list(pos)
         self.velocity = [0.0, 0.0]
         self.radius = config.PLAYER_SIZE // 2
-        self.enemy_type = enemy_type
-        self.id = f"enemy_{random.randint(1000, 9999)}"
+        # Every spawn gets a fresh serial, so bullets fired in a pooled
+        # enemy's previous life don't count as its own
+        Enemy._next_serial += 1
+        self.serial = Enemy._next_serial
+        self.id = f"enemy_{self.serial}"
+        self.owner_int_id = OwnerRegistry.register(self.id)  # Compared against bullet.owner_id
         self.is_boss = False  # Will be set to True for boss enemies
         
         # Health and combat (apply difficulty modifiers)
@@ -43,17 +109,17 @@ class Enemy:
         self.ai_behavior = None
         
         # Combat
-        self.weapon: Optional[Weapon] = None
         self.bullets = None
         self.bullet_manager = None
         self.particle_emitter = None
+        self.game = None  # Set by set_game_reference
         
         # State
         self.state = AIState.PATROL
         self.alive = True
-        self.spawn_time = pygame.time.get_ticks() / 1000.0
         self.invincible = True
         self.invincibility_timer = config.ENEMY_SPAWN_INVINCIBILITY
+        self._draw_flash = bool(int(self.invincibility_timer * 5) % 2)  # Flash phase for draw
         
         # Statistics
         self.damage_dealt = 0
@@ -63,6 +129,20 @@ class Enemy:
         self.color = (255, 0, 0)  # Default red
         self.collision_manager = None
     
+    @property
+    def look_direction(self) -> float:
+        """Facing angle in radians"""
+        return self._look_direction
+    
+    @look_direction.setter
+    def look_direction(self, angle: float):
+        # The AI sets this at its decision rate while drawing reads it every
+        # frame, so keep the trig alongside the angle
+        self._look_direction = angle
+        self._look_cos = math.cos(angle)
+        self._look_sin = math.sin(angle)
+        self._look_step = round(angle * DIRECTION_STEPS / math.tau) % DIRECTION_STEPS
+    
     def update(self, dt: float, player, all_entities: List, current_time: float):
         """Update enemy state"""
         if not self.alive:
@@ -73,6 +153,7 @@ class Enemy:
             self.invincibility_timer -= dt
             if self.invincibility_timer <= 0:
                 self.invincible = False
+            self._draw_flash = self.invincible and bool(int(self.invincibility_timer * 5) % 2)
         
         # Update AI behavior
         if self.ai_behavior:
@@ -88,31 +169,34 @@ class Enemy:
     
     def _update_movement(self, dt: float):
         """Update enemy movement"""
-        # Calculate velocity from move direction
-        if self.move_direction != (0.0, 0.0):
-            self.velocity[0] = self.move_direction[0] * self.speed
-            self.velocity[1] = self.move_direction[1] * self.speed
-        else:
-            self.velocity[0] = 0
-            self.velocity[1] = 0
+        # Work on scalar locals and write the lists back once
+        move_x, move_y = self.move_direction
+        speed = self.speed
+        velocity = self.velocity
+        vel_x = move_x * speed
+        vel_y = move_y * speed
+        velocity[0] = vel_x
+        velocity[1] = vel_y
         
         # Update position
-        new_x = self.pos[0] + self.velocity[0] * dt
-        new_y = self.pos[1] + self.velocity[1] * dt
+        pos = self.pos
+        radius = self.radius
+        new_x = pos[0] + vel_x * dt
+        new_y = pos[1] + vel_y * dt
         
         # Boundary checking
-        new_x = max(self.radius, min(new_x, config.SCREEN_WIDTH - self.radius))
-        new_y = max(self.radius, min(new_y, config.SCREEN_HEIGHT - self.radius))
-        
-        # Wall collision
-        if self.collision_manager:
-            test_pos = (new_x, new_y)
-            if self.collision_manager.check_entity_wall_collision(test_pos, self.radius):
-                new_pos = self.collision_manager.resolve_entity_wall_collision(test_pos, self.radius)
-                new_x, new_y = new_pos
-        
-        self.pos[0] = new_x
-        self.pos[1] = new_y
+        max_x = SCREEN_RIGHT - radius
+        max_y = SCREEN_BOTTOM - radius
+        new_x = radius if new_x < radius else max_x if new_x > max_x else new_x
+        new_y = radius if new_y < radius else max_y if new_y > max_y else new_y
+        
+        # Wall collision (resolving is a no-op when no wall overlaps)
+        collision_manager = self.collision_manager
+        if collision_manager:
+            new_x, new_y = collision_manager.resolve_entity_wall_collision((new_x, new_y), radius)
+        
+        pos[0] = new_x
+        pos[1] = new_y
     
     def take_damage(self, amount: int, attacker_id: str = None):
         """Apply damage to enemy"""
@@ -132,13 +216,16 @@ class Enemy:
     def die(self, killer_id: str = None):
         """Handle enemy death"""
         self.alive = False
+        self.state = AIState.DEAD
+        if self.ai_behavior:
+            self.ai_behavior.state = AIState.DEAD
         
         # Create death explosion
         if self.particle_emitter:
             self.particle_emitter.create_death_explosion(self.pos, self.color)
         
         # Notify game of death
-        if hasattr(self, 'game') and self.game:
+        if self.game:
             self.game.on_enemy_killed(self, killer_id)
     
     def fire_weapon(self):
@@ -146,9 +233,13 @@ class Enemy:
         if not self.weapon or not self.bullet_manager:
             return
         
+        # Most calls land on cooldown or reload, skip building the fire position
+        if not self.weapon.can_fire():
+            return
+        
         # Calculate fire position
-        fire_pos = (self.pos[0] + math.cos(self.look_direction) * 30,
-                   self.pos[1] + math.sin(self.look_direction) * 30)
+        fire_pos = (self.pos[0] + self._look_cos * 30,
+                   self.pos[1] + self._look_sin * 30)
         
         # Fire weapon
         fired = self.weapon.fire(fire_pos, self.look_direction, self.id,
@@ -160,7 +251,8 @@ class Enemy:
     def make_boss(self):
         """Convert this enemy into a boss"""
         self.is_boss = True
-        self.id = f"BOSS_{random.randint(1000, 9999)}"
+        self.id = f"BOSS_{self.serial}"
+        self.owner_int_id = OwnerRegistry.register(self.id)
         
         # Apply boss multipliers
         self.max_health = int(self.max_health * config.BOSS_HEALTH_MULTIPLIER)
@@ -171,8 +263,7 @@ class Enemy:
         self.detection_range = int(self.detection_range * 1.5)  # Bosses detect from further
         
         # Visual distinction - make boss darker/more menacing
-        r, g, b = self.color
-        self.color = (min(255, r + 50), max(0, g - 50), max(0, b - 50))
+        self.color = BOSS_COLORS.get(self.color) or _boss_shade(self.color)
         
         # Boost weapon if available
         if self.weapon:
@@ -184,37 +275,49 @@ class Enemy:
         if not self.alive:
             return
         
-        # Draw enemy body
-        enemy_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+        self.draw_body(screen)
         
+        # Draw health bar (bigger for bosses), hidden at full health
+        if self.health < self.max_health:
+            screen.blits(self.get_health_bar_blits(), doreturn=False)
+    
+    def draw_body(self, screen: pygame.Surface):
+        """Draw the enemy without its health bar"""
         # Flash when invincible
-        if self.invincible and int(self.invincibility_timer * 5) % 2:
+        if self._draw_flash:
             color = (255, 255, 255)
         else:
             color = self.color
         
-        pygame.draw.circle(enemy_surface, color, (self.radius, self.radius), self.radius)
-        
-        # Draw direction indicator
-        end_x = self.radius + math.cos(self.look_direction) * self.radius * 0.7
-        end_y = self.radius + math.sin(self.look_direction) * self.radius * 0.7
-        pygame.draw.line(enemy_surface, (255, 255, 255), 
-                        (self.radius, self.radius), (end_x, end_y), 2)
-        
-        # Draw type indicator
-        self._draw_type_indicator(enemy_surface)
-        
-        # Draw boss crown if this is a boss
-        if self.is_boss:
-            self._draw_boss_crown(enemy_surface)
-        
-        # Draw to screen
-        screen.blit(enemy_surface, 
-                   (int(self.pos[0] - self.radius), 
-                    int(self.pos[1] - self.radius)))
-        
-        # Draw health bar (bigger for bosses)
-        self._draw_health_bar(screen)
+        # Draw enemy body with its direction indicator
+        screen.blit(self._get_body_surface(color, self._look_step),
+                    (int(self.pos[0] - self.radius), int(self.pos[1] - self.radius)))
+    
+    def _get_body_surface(self, color: Tuple[int, int, int], look_step: int) -> pygame.Surface:
+        """Get the cached body sprite (circle, direction indicator, type
+        indicator and crown), rendering it on first use"""
+        key = (self.enemy_type, self.is_boss, color, self.radius, look_step)
+        body_surface = _BODY_CACHE.get(key)
+        if body_surface is None:
+            body_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(body_surface, color, (self.radius, self.radius), self.radius)
+            
+            # Draw direction indicator at the quantized look angle
+            angle = look_step * math.tau / DIRECTION_STEPS
+            end_x = self.radius + math.cos(angle) * self.radius * 0.7
+            end_y = self.radius + math.sin(angle) * self.radius * 0.7
+            pygame.draw.line(body_surface, (255, 255, 255), 
+                            (self.radius, self.radius), (end_x, end_y), 2)
+            
+            self._draw_type_indicator(body_surface)
+            
+            # Draw boss crown if this is a boss
+            if self.is_boss:
+                self._draw_boss_crown(body_surface)
+            
+            body_surface = to_display_format(body_surface)
+            _BODY_CACHE[key] = body_surface
+        return body_surface
     
     def _draw_type_indicator(self, surface: pygame.Surface):
         """Draw indicator showing enemy type"""
@@ -286,17 +389,13 @@ class Enemy:
         pygame.draw.polygon(surface, crown_color, points)
         pygame.draw.polygon(surface, (200, 180, 0), points, 2)  # Border
     
-    def _draw_health_bar(self, screen: pygame.Surface):
-        """Draw enemy health bar"""
+    def get_health_bar_blits(self) -> List[Tuple]:
+        """Get (surface, dest, area) blits for the enemy health bar"""
         bar_width = 40 if self.is_boss else 30  # Bigger health bar for bosses
         bar_height = 6 if self.is_boss else 4
         bar_x = self.pos[0] - bar_width // 2
         bar_y = self.pos[1] - self.radius - (15 if self.is_boss else 10)
         
-        # Background
-        pygame.draw.rect(screen, (50, 50, 50), 
-                        (bar_x, bar_y, bar_width, bar_height))
-        
         # Health bar
         health_ratio = self.health / self.max_health
         health_width = int(bar_width * health_ratio)
@@ -309,8 +408,10 @@ class Enemy:
         else:
             color = (255, 0, 0)  # Red
         
-        pygame.draw.rect(screen, color, 
-                        (bar_x, bar_y, health_width, bar_height))
+        # Background, then the full-width strip cropped to the health left
+        return [(get_bar_surface((50, 50, 50), bar_width, bar_height), (bar_x, bar_y)),
+                (get_bar_surface(color, bar_width, bar_height), (bar_x, bar_y),
+                 (0, 0, health_width, bar_height))]
     
     def is_dead(self) -> bool:
         """Check if enemy is dead"""
@@ -336,67 +437,106 @@ class Enemy:
 class Rusher(Enemy):
     """Rusher enemy - Charges directly at player"""
     
+    __slots__ = ()
+    
     def __init__(self, pos: Tuple[float, float]):
         super().__init__(pos, 'rusher')
+    
+    def reset(self, pos: Tuple[float, float]):
+        """Reset enemy for reuse (object pooling)"""
+        super().reset(pos)
         self.color = config.ENEMY_RUSHER_COLOR
         self.speed = config.RUSHER_SPEED
         self.max_health = config.ENEMY_BASE_HEALTH
         self.health = self.max_health
-        self.weapon = SMG()
+        if self.weapon is None:
+            self.weapon = SMG()
         self.ai_behavior = None  # Will be set after collision manager is available
 
 
 class Sniper(Enemy):
     """Sniper enemy - Maintains distance and fires accurately"""
     
+    __slots__ = ()
+    
     def __init__(self, pos: Tuple[float, float]):
         super().__init__(pos, 'sniper')
+    
+    def reset(self, pos: Tuple[float, float]):
+        """Reset enemy for reuse (object pooling)"""
+        super().reset(pos)
         self.color = config.ENEMY_SNIPER_COLOR
         self.speed = config.SNIPER_SPEED
         self.max_health = config.ENEMY_BASE_HEALTH + 10
         self.health = self.max_health
-        self.weapon = Rifle()
+        if self.weapon is None:
+            self.weapon = Rifle()
         self.ai_behavior = None
 
 
 class Dodger(Enemy):
     """Dodger enemy - Strafes and dodges bullets"""
     
+    __slots__ = ()
+    
     def __init__(self, pos: Tuple[float, float]):
         super().__init__(pos, 'dodger')
+    
+    def reset(self, pos: Tuple[float, float]):
+        """Reset enemy for reuse (object pooling)"""
+        super().reset(pos)
         self.color = config.ENEMY_DODGER_COLOR
         self.speed = config.DODGER_SPEED
         self.max_health = config.ENEMY_BASE_HEALTH + 20
         self.health = self.max_health
-        self.weapon = Shotgun()
+        if self.weapon is None:
+            self.weapon = Shotgun()
         self.ai_behavior = None
 
 
 class Flanker(Enemy):
     """Flanker enemy - Tries to attack from sides/back"""
     
+    __slots__ = ()
+    
     def __init__(self, pos: Tuple[float, float]):
         super().__init__(pos, 'flanker')
+    
+    def reset(self, pos: Tuple[float, float]):
+        """Reset enemy for reuse (object pooling)"""
+        super().reset(pos)
         self.color = config.ENEMY_FLANKER_COLOR
         self.speed = config.FLANKER_SPEED
         self.max_health = config.ENEMY_BASE_HEALTH + 15
         self.health = self.max_health
-        self.weapon = Rifle()
+        if self.weapon is None:
+            self.weapon = Rifle()
         self.ai_behavior = None
 
 
+class SpawnRequest(NamedTuple):
+    """A queued enemy spawn"""
+    type: str
+    pos: Tuple[float, float]
+    spawn_delay: float
+    is_boss: bool
+
+
 class EnemySpawner:
     """Handles enemy spawning and management"""
     
     def __init__(self):
         self.enemies: List[Enemy] = []
-        self.spawn_queue: List[Dict] = []
+        self.spawn_queue: List[SpawnRequest] = []
         self.spawn_timer = 0
         self.wave_number = 0
+        self.player_tracker = PlayerTracker()  # Shared by every enemy AI
+        self.enemy_pool: Dict[str, List[Enemy]] = {}  # Removed enemies for reuse, by type
     
     def start_wave(self, wave_number: int, map_generator):
         """Start a new wave of enemies"""
         self.wave_number = wave_number
+        self._release_enemies(self.enemies)
         self.enemies.clear()
         self.spawn_queue.clear()
         
@@ -412,22 +552,22 @@ class EnemySpawner:
             
             # Make the first enemy a boss
             boss_pos = map_generator.get_spawn_position('enemy', 0, enemy_count)
-            self.spawn_queue.append({
-                'type': enemy_types[0],
-                'pos': boss_pos,
-                'spawn_delay': 1.0,
-                'is_boss': True
-            })
+            self.spawn_queue.append(SpawnRequest(
+                type=enemy_types[0],
+                pos=boss_pos,
+                spawn_delay=1.0,
+                is_boss=True
+            ))
             
             # Add remaining regular enemies
             for i, enemy_type in enumerate(enemy_types[1:], start=1):
                 spawn_pos = map_generator.get_spawn_position('enemy', i, enemy_count)
-                self.spawn_queue.append({
-                    'type': enemy_type,
-                    'pos': spawn_pos,
-                    'spawn_delay': random.uniform(1.5, 3.0),
-                    'is_boss': False
-                })
+                self.spawn_queue.append(SpawnRequest(
+                    type=enemy_type,
+                    pos=spawn_pos,
+                    spawn_delay=random.uniform(1.5, 3.0),
+                    is_boss=False
+                ))
         else:
             # Regular wave (apply difficulty multiplier to enemy count)
             base_count = config.WAVE_BASE_ENEMIES + (wave_number - 1) * config.WAVE_ENEMY_INCREMENT
@@ -437,12 +577,12 @@ class EnemySpawner:
             # Queue enemies for spawning
             for i, enemy_type in enumerate(enemy_types):
                 spawn_pos = map_generator.get_spawn_position('enemy', i, enemy_count)
-                self.spawn_queue.append({
-                    'type': enemy_type,
-                    'pos': spawn_pos,
-                    'spawn_delay': random.uniform(0.5, 2.0),
-                    'is_boss': False
-                })
+                self.spawn_queue.append(SpawnRequest(
+                    type=enemy_type,
+                    pos=spawn_pos,
+                    spawn_delay=random.uniform(0.5, 2.0),
+                    is_boss=False
+                ))
         
         self.spawn_timer = config.WAVE_BREAK_TIME
     
@@ -474,9 +614,8 @@ class EnemySpawner:
             types = ['rusher', 'sniper', 'dodger', 'flanker']
             weights = [0.3, 0.3, 0.25, 0.15]  # Adjust weights as needed
             
-            for i in range(enemy_count):
-                enemy_type = random.choices(types, weights)[0]
-                enemy_types.append(enemy_type)
+            # Independent draws are already in random order, no shuffle needed
+            return random.choices(types, weights, k=enemy_count)
         
         # Shuffle to randomize spawn order
         random.shuffle(enemy_types)
@@ -485,6 +624,9 @@ class EnemySpawner:
     def update(self, dt: float, player, all_entities: List, current_time: float,
                collision_manager, particle_emitter, bullet_manager, game):
         """Update enemy spawner and enemies"""
+        # Record the player once per frame for every AI's prediction
+        self.player_tracker.record(player)
+        
         # Handle spawning
         if self.spawn_timer > 0:
             self.spawn_timer -= dt
@@ -492,10 +634,10 @@ class EnemySpawner:
         elif self.spawn_queue:
             # Spawn next enemy
             spawn_data = self.spawn_queue.pop(0)
-            enemy = self._create_enemy(spawn_data['type'], spawn_data['pos'])
+            enemy = self._create_enemy(spawn_data.type, spawn_data.pos)
             
             # Make this enemy a boss if specified
-            if spawn_data.get('is_boss', False):
+            if spawn_data.is_boss:
                 enemy.make_boss()
             
             # Set up enemy
@@ -506,30 +648,45 @@ class EnemySpawner:
             
             # Set up AI behavior
             if enemy.enemy_type == 'rusher':
-                enemy.ai_behavior = RusherAI(enemy, collision_manager)
+                enemy.ai_behavior = RusherAI(enemy, collision_manager, self.player_tracker)
             elif enemy.enemy_type == 'sniper':
-                enemy.ai_behavior = SniperAI(enemy, collision_manager)
+                enemy.ai_behavior = SniperAI(enemy, collision_manager, self.player_tracker)
             elif enemy.enemy_type == 'dodger':
-                enemy.ai_behavior = DodgerAI(enemy, collision_manager)
+                enemy.ai_behavior = DodgerAI(enemy, collision_manager, self.player_tracker)
             elif enemy.enemy_type == 'flanker':
-                enemy.ai_behavior = FlankerAI(enemy, collision_manager)
+                enemy.ai_behavior = FlankerAI(enemy, collision_manager, self.player_tracker)
             
             self.enemies.append(enemy)
             
             # Set timer for next spawn
             if self.spawn_queue:
-                self.spawn_timer = self.spawn_queue[0]['spawn_delay']
+                self.spawn_timer = self.spawn_queue[0].spawn_delay
         
         # Update existing enemies
-        for enemy in self.enemies[:]:
+        for enemy in self.enemies:
             enemy.update(dt, player, all_entities, current_time)
-            
-            # Remove dead enemies
-            if enemy.is_dead():
-                self.enemies.remove(enemy)
+        
+        # Remove dead enemies in one pass
+        dead_enemies = [enemy for enemy in self.enemies if not enemy.alive]
+        if dead_enemies:
+            self._release_enemies(dead_enemies)
+            self.enemies[:] = [enemy for enemy in self.enemies if enemy.alive]
+    
+    def _release_enemies(self, enemies: List[Enemy]):
+        """Keep removed enemies for reuse by later spawns"""
+        if config.ENABLE_OBJECT_POOLING:
+            for enemy in enemies:
+                enemy.ai_behavior = None  # Break the enemy <-> AI reference cycle
+                self.enemy_pool.setdefault(enemy.enemy_type, []).append(enemy)
     
     def _create_enemy(self, enemy_type: str, pos: Tuple[float, float]) -> Enemy:
-        """Create an enemy of the specified type"""
+        """Create an enemy of the specified type, reusing a pooled one if possible"""
+        pool = self.enemy_pool.get(enemy_type)
+        if pool:
+            enemy = pool.pop()
+            enemy.reset(pos)
+            return enemy
+        
         if enemy_type == 'rusher':
             return Rusher(pos)
         elif enemy_type == 'sniper':
@@ -543,8 +700,23 @@ class EnemySpawner:
     
     def draw(self, screen: pygame.Surface):
         """Draw all enemies"""
+        # Health bars go on top of every body and are blitted in one call
+        bar_blits = []
         for enemy in self.enemies:
-            enemy.draw(screen)
+            if not enemy.alive:
+                continue
+            
+            # Skip enemies entirely off screen
+            x, y = enemy.pos
+            radius = enemy.radius
+            if not (-radius < x < SCREEN_RIGHT + radius and -radius < y < SCREEN_BOTTOM + radius):
+                continue
+            
+            enemy.draw_body(screen)
+            # Untouched enemies show no health bar
+            if enemy.health < enemy.max_health:
+                bar_blits.extend(enemy.get_health_bar_blits())
+        screen.blits(bar_blits, doreturn=False)
     
     def get_active_enemies(self) -> List[Enemy]:
         """Get list of active enemies"""
@@ -560,5 +732,6 @@ class EnemySpawner:
     
     def clear_all_enemies(self):
         """Clear all enemies"""
+        self._release_enemies(self.enemies)
         self.enemies.clear()
         self.spawn_queue.clear()
\ No newline at end of file
@@ -13,7 +13,7 @@ from typing import List, Optional
 import config
 from player import Player
 from enemy import EnemySpawner
-from bullet import BulletManager
+from bullet import BulletManager, OwnerRegistry
 from map import MapGenerator
 from ui import UI
 from collision import CollisionManager
@@ -37,6 +37,9 @@ class Game:
         self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         pygame.display.set_caption("Death Circuit - 2D Combat Arena")
         
+        # Offscreen world surface for screen shake, allocated once
+        self.shake_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)).convert()
+        
         # Clock for frame rate control
         self.clock = pygame.time.Clock()
         
@@ -56,11 +59,15 @@ class Game:
         
         # Game timing
         self.current_time = 0
-        self.last_time = pygame.time.get_ticks() / 1000.0
+        self.start_ns = time.monotonic_ns()  # Monotonic, immune to wall-clock changes
+        self.last_ns = self.start_ns
         self.wave_number = 1
         self.wave_break_timer = 0
         self.enemies_remaining = 0
         
+        # Player plus active enemies, refilled in place each frame
+        self.all_entities: List = []
+        
         # Statistics
         self.total_kills = 0
         self.highest_wave = 0
@@ -92,10 +99,10 @@ class Game:
         """Main game loop"""
         while self.running:
             # Calculate delta time
-            current_ticks = pygame.time.get_ticks() / 1000.0
-            dt = current_ticks - self.last_time
-            self.last_time = current_ticks
-            self.current_time = current_ticks
+            now_ns = time.monotonic_ns()
+            dt = (now_ns - self.last_ns) * 1e-9
+            self.last_ns = now_ns
+            self.current_time = (now_ns - self.start_ns) * 1e-9
             
             # Limit frame rate
             dt = min(dt, 1/30)  # Prevent large time steps
@@ -245,7 +252,10 @@ class Game:
         self._update_wave_system(dt)
         
         # Update enemies
-        all_entities = [self.player] + self.enemy_spawner.get_active_enemies()
+        all_entities = self.all_entities
+        all_entities.clear()
+        all_entities.append(self.player)
+        all_entities.extend(self.enemy_spawner.get_active_enemies())
         self.enemy_spawner.update(dt, self.player, all_entities, self.current_time,
                                 self.collision_manager, self.particle_emitter,
                                 self.bullet_manager, self)
@@ -294,8 +304,11 @@ class Game:
         for enemy in self.enemy_spawner.get_active_enemies():
             self.collision_manager.add_to_spatial_grid(enemy, enemy.pos, enemy.radius)
         
-        # Bullet-entity collisions
-        for bullet in self.bullet_manager.bullets[:]:
+        # Bullet-entity collisions, narrow-phase tested for all bullets at once
+        bullet_hits = self.collision_manager.check_bullets_entity_collisions(
+            self.bullet_manager.bullets
+        )
+        for bullet in self.bullet_manager.bullets:
             if not bullet.alive:
                 continue
             
@@ -309,20 +322,20 @@ class Game:
                 continue
             
             # Check collision with entities
-            hit_entities = self.collision_manager.check_bullet_entity_collision(
-                bullet.pos, bullet.radius, self.enemy_spawner.get_active_enemies() + [self.player]
-            )
+            hit_entities = bullet_hits.get(bullet)
+            if not hit_entities:
+                continue
             
             for entity in hit_entities:
                 # Check if entity is alive (handle both Player and Enemy)
                 entity_alive = not entity.is_dead() if isinstance(entity, Player) else entity.alive
-                if entity_alive and bullet.owner_id != entity.id:
+                if entity_alive and bullet.owner_id != entity.owner_int_id:
                     # Handle different take_damage signatures
                     if isinstance(entity, Player):
                         entity.take_damage(bullet.damage, self.current_time)
                         entity.damage_taken += bullet.damage
                     else:
-                        entity.take_damage(bullet.damage, bullet.owner_id)
+                        entity.take_damage(bullet.damage, OwnerRegistry.name_of(bullet.owner_id))
                     
                     # Mark bullet as hit
                     bullet.alive = False
@@ -336,27 +349,40 @@ class Game:
                     
                     break  # Bullet can only hit one entity
         
-        # Entity-entity collisions
+        # Entity-entity collisions, only for pairs sharing a grid cell
         enemies = self.enemy_spawner.get_active_enemies()
-        for i, enemy1 in enumerate(enemies):
-            for enemy2 in enemies[i+1:]:
-                if (self.collision_manager.check_entity_entity_collision(
-                    enemy1.pos, enemy1.radius, enemy2.pos, enemy2.radius)):
-                    
-                    # Resolve collision
-                    new_pos1, new_pos2 = self.collision_manager.resolve_entity_entity_collision(
-                        enemy1.pos, enemy1.radius, enemy2.pos, enemy2.radius
-                    )
-                    enemy1.pos = list(new_pos1)
-                    enemy2.pos = list(new_pos2)
-        
-        # Player-enemy collisions (contact damage)
+        for enemy1, enemy2 in self.collision_manager.get_entity_pairs():
+            if enemy1 is self.player or enemy2 is self.player:
+                continue  # Player contact is handled below
+            
+            # Squared-distance overlap test inline, only overlaps reach the resolver
+            pos1 = enemy1.pos
+            pos2 = enemy2.pos
+            dx = pos1[0] - pos2[0]
+            dy = pos1[1] - pos2[1]
+            radius_sum = enemy1.radius + enemy2.radius
+            if dx * dx + dy * dy < radius_sum * radius_sum:
+                
+                # Resolve collision
+                new_pos1, new_pos2 = self.collision_manager.resolve_entity_entity_collision(
+                    enemy1.pos, enemy1.radius, enemy2.pos, enemy2.radius
+                )
+                enemy1.pos = list(new_pos1)
+                enemy2.pos = list(new_pos2)
+        
+        # Player-enemy collisions (contact damage), tested inline with squared distances
+        player_radius = self.player.radius
         for enemy in enemies:
             if not enemy.alive:
                 continue
             
-            if self.collision_manager.check_entity_entity_collision(
-                self.player.pos, self.player.radius, enemy.pos, enemy.radius):
+            # Re-read the player position, earlier pushes may have moved it
+            player_pos = self.player.pos
+            enemy_pos = enemy.pos
+            dx = player_pos[0] - enemy_pos[0]
+            dy = player_pos[1] - enemy_pos[1]
+            contact_distance = player_radius + enemy.radius
+            if dx * dx + dy * dy < contact_distance * contact_distance:
                 
                 # Apply contact damage to player (with cooldown)
                 time_since_last_contact = self.current_time - self.player.last_contact_damage_time
@@ -387,10 +413,10 @@ class Game:
             # Apply screen shake if needed
             shake_offset = self.player.get_screen_shake_offset()
             if shake_offset != (0, 0):
-                # Create temporary surface for screen shake effect
-                temp_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-                self._draw_game_world(temp_surface)
-                self.screen.blit(temp_surface, shake_offset)
+                # Draw the world offscreen, then blit it offset for the shake effect
+                self.shake_surface.fill((0, 0, 0))
+                self._draw_game_world(self.shake_surface)
+                self.screen.blit(self.shake_surface, shake_offset)
             else:
                 self._draw_game_world(self.screen)
             
@@ -6,10 +6,14 @@ Handles procedural arena generation and wall placement
 import pygame
 import random
 from typing import List, Tuple, Optional
-from utils import line_of_sight
+from utils import line_of_sight, to_display_format
 import config
 
 
+# Transparent color for the pre-rendered map layer (not used by grid or walls)
+MAP_COLORKEY = (255, 0, 255)
+
+
 class MapGenerator:
     """Generates procedural arena layouts"""
     
@@ -18,6 +22,17 @@ class MapGenerator:
         self.spawn_zones: List[Tuple[int, int]] = []
         self.player_spawn = (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
         self._generate_spawn_zones()
+        
+        # Sight lines (zone, min_x, min_y, max_x, max_y) from the player spawn
+        # that no current wall blocks
+        self._visible_zones: List[Tuple] = list(self._zone_sight_boxes)
+        
+        # Grid and walls pre-rendered on a colorkeyed layer, rebuilt when walls change
+        self._map_surface: Optional[pygame.Surface] = None
+        
+        # Wall bevel edge colors
+        self._bevel_light = self._lighten_color(config.WALL_COLOR, 0.3)
+        self._bevel_dark = self._darken_color(config.WALL_COLOR, 0.3)
     
     def _generate_spawn_zones(self):
         """Generate enemy spawn zones around the edges"""
@@ -47,10 +62,18 @@ class MapGenerator:
             zones.append((50, y))
         
         self.spawn_zones = zones
+        
+        # Bounding box of each sight line from the player spawn to a zone
+        center_x, center_y = config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2
+        self._zone_sight_boxes = [(zone, min(center_x, zone[0]), min(center_y, zone[1]),
+                                   max(center_x, zone[0]), max(center_y, zone[1]))
+                                  for zone in zones]
     
     def generate_arena(self, wave_number: int) -> List[pygame.Rect]:
         """Generate a new arena layout for the given wave"""
         self.walls.clear()
+        self._visible_zones = list(self._zone_sight_boxes)
+        self._map_surface = None
         
         # Determine number of walls based on wave
         # More walls in higher waves for more complex gameplay
@@ -63,8 +86,12 @@ class MapGenerator:
         
         while len(self.walls) < wall_count and attempts < max_attempts:
             wall = self._generate_wall()
-            if wall and self._is_wall_valid(wall):
-                self.walls.append(wall)
+            if wall:
+                visible_zones = self._get_visible_zones_with(wall)
+                if visible_zones is not None:
+                    # Accept the wall and commit the sight lines it leaves open
+                    self.walls.append(wall)
+                    self._visible_zones = visible_zones
             attempts += 1
         
         return self.walls
@@ -101,9 +128,10 @@ class MapGenerator:
         wall_center_x = wall.centerx
         wall_center_y = wall.centery
         
-        distance_to_center = ((wall_center_x - center_x)**2 + (wall_center_y - center_y)**2)**0.5
+        # Compare squared distances to avoid the sqrt
+        distance_to_center_sq = (wall_center_x - center_x)**2 + (wall_center_y - center_y)**2
         
-        if distance_to_center < config.WALL_CLEARANCE_CENTER:
+        if distance_to_center_sq < config.WALL_CLEARANCE_CENTER ** 2:
             return False
         
         # Check distance from edges
@@ -115,28 +143,34 @@ class MapGenerator:
         
         return True
     
-    def _is_wall_valid(self, new_wall: pygame.Rect) -> bool:
-        """Check if a new wall is valid (doesn't block all paths)"""
+    def _get_visible_zones_with(self, new_wall: pygame.Rect) -> Optional[List[Tuple]]:
+        """Check if a new wall is valid (doesn't block all paths), returning the
+        sight lines still open with it added, or None if it is invalid"""
         # Check overlap with existing walls
-        for existing_wall in self.walls:
-            if new_wall.colliderect(existing_wall):
-                return False
+        if new_wall.collidelist(self.walls) != -1:
+            return None
         
         # Check if it creates isolated areas (simplified check)
         # This prevents walls from completely blocking off sections
         player_pos = (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
         
-        # Check if wall blocks too much of the arena
-        temp_walls = self.walls + [new_wall]
-        
-        # Check if we can still reach some spawn zones
-        reachable_zones = 0
-        for zone in self.spawn_zones:
-            if line_of_sight(player_pos, zone, temp_walls):
-                reachable_zones += 1
+        # Zones hidden by the existing walls stay hidden, so only the zones
+        # still visible need testing, and only against the new wall
+        new_wall_only = [new_wall]
+        left, top, right, bottom = new_wall.left, new_wall.top, new_wall.right, new_wall.bottom
+        visible_zones = []
+        for sight_box in self._visible_zones:
+            zone, min_x, min_y, max_x, max_y = sight_box
+            # A sight line can only cross the wall if its bounding box touches it
+            if (right < min_x or left > max_x or bottom < min_y or top > max_y or
+                    line_of_sight(player_pos, zone, new_wall_only)):
+                visible_zones.append(sight_box)
         
         # Need to be able to reach at least some spawn zones
-        return reachable_zones >= len(self.spawn_zones) // 2
+        if len(visible_zones) < len(self.spawn_zones) // 2:
+            return None
+        
+        return visible_zones
     
     def get_spawn_position(self, entity_type: str, index: int, total_entities: int) -> Tuple[int, int]:
         """Get a spawn position for an entity"""
@@ -160,16 +194,29 @@ class MapGenerator:
     
     def draw(self, screen: pygame.Surface):
         """Draw the map (walls and grid)"""
+        if self._map_surface is None:
+            self._map_surface = self._render_map_surface()
+        screen.blit(self._map_surface, (0, 0))
+    
+    def _render_map_surface(self) -> pygame.Surface:
+        """Render the grid and walls once onto a layer that blits over any background"""
+        map_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        map_surface.fill(MAP_COLORKEY)
+        
         # Draw background grid
-        self._draw_grid(screen)
+        self._draw_grid(map_surface)
         
         # Draw walls
         for wall in self.walls:
             # Main wall color
-            pygame.draw.rect(screen, config.WALL_COLOR, wall)
+            pygame.draw.rect(map_surface, config.WALL_COLOR, wall)
             
             # Add beveled edge effect
-            self._draw_wall_bevel(screen, wall)
+            self._draw_wall_bevel(map_surface, wall)
+        
+        map_surface = to_display_format(map_surface, alpha=False)
+        map_surface.set_colorkey(MAP_COLORKEY, pygame.RLEACCEL)
+        return map_surface
     
     def _draw_grid(self, screen: pygame.Surface):
         """Draw the background grid"""
@@ -186,14 +233,14 @@ class MapGenerator:
     def _draw_wall_bevel(self, screen: pygame.Surface, wall: pygame.Rect):
         """Draw beveled edges on walls for 3D effect"""
         # Light edge (top and left)
-        light_color = self._lighten_color(config.WALL_COLOR, 0.3)
+        light_color = self._bevel_light
         pygame.draw.line(screen, light_color, 
                         (wall.left, wall.top), (wall.right - 1, wall.top), 2)
         pygame.draw.line(screen, light_color, 
                         (wall.left, wall.top), (wall.left, wall.bottom - 1), 2)
         
         # Dark edge (bottom and right)
-        dark_color = self._darken_color(config.WALL_COLOR, 0.3)
+        dark_color = self._bevel_dark
         pygame.draw.line(screen, dark_color, 
                         (wall.left + 1, wall.bottom - 1), 
                         (wall.right, wall.bottom - 1), 2)
@@ -224,28 +271,29 @@ class MapGenerator:
     def is_position_in_wall(self, pos: Tuple[float, float], radius: float = 0) -> bool:
         """Check if a position is inside a wall"""
         point_rect = pygame.Rect(pos[0] - radius, pos[1] - radius, radius * 2, radius * 2)
-        
-        for wall in self.walls:
-            if wall.colliderect(point_rect):
-                return True
-        
-        return False
+        return point_rect.collidelist(self.walls) != -1
     
     def get_nearest_wall_distance(self, pos: Tuple[float, float]) -> float:
         """Get distance to nearest wall"""
-        min_distance = float('inf')
+        if not self.walls:
+            return 1000
         
+        # Track the smallest squared distance and take one sqrt at the end
+        x, y = pos
+        min_distance_sq = float('inf')
         for wall in self.walls:
             # Calculate closest point on wall
-            closest_x = max(wall.left, min(pos[0], wall.right))
-            closest_y = max(wall.top, min(pos[1], wall.bottom))
-            
-            # Calculate distance
-            distance = ((pos[0] - closest_x)**2 + (pos[1] - closest_y)**2)**0.5
-            min_distance = min(min_distance, distance)
-        
-        return min_distance if min_distance != float('inf') else 1000
+            left, top, right, bottom = wall.left, wall.top, wall.right, wall.bottom
+            dx = x - (left if x < left else right if x > right else x)
+            dy = y - (top if y < top else bottom if y > bottom else y)
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < min_distance_sq:
+                min_distance_sq = distance_sq
+        
+        return min_distance_sq ** 0.5
     
     def clear_walls(self):
         """Clear all walls"""
-        self.walls.clear()
\ No newline at end of file
+        self.walls.clear()
+        self._visible_zones = list(self._zone_sight_boxes)
+        self._map_surface = None
\ No newline at end of file
@@ -7,67 +7,69 @@ import pygame
 import random
 import math
 from typing import List, Tuple, Optional
-from utils import normalize_vector, vector_from_angle
+from utils import normalize_vector, to_display_format
 import config
 
 
+# Pre-rendered premultiplied particle sprites keyed by (color, size, alpha bucket)
+_PARTICLE_CACHE = {}
+PARTICLE_ALPHA_LEVELS = 16
+PARTICLE_CACHE_LIMIT = 8192  # Cache is flushed when it grows past this
+
+# Particle colors are rounded to steps of 16 per channel so particles share sprites
+_COLOR_STEPS = tuple(min(255, (value + 8) & ~15) for value in range(256))
+
+
+def get_particle_surface(color: Tuple[int, int, int], size: int, alpha_bucket: int) -> pygame.Surface:
+    """Get a cached particle sprite, rendering it on first use"""
+    key = (color, size, alpha_bucket)
+    particle_surface = _PARTICLE_CACHE.get(key)
+    if particle_surface is None:
+        if len(_PARTICLE_CACHE) >= PARTICLE_CACHE_LIMIT:
+            _PARTICLE_CACHE.clear()
+        alpha = min(255, 255 * alpha_bucket // (PARTICLE_ALPHA_LEVELS - 1))
+        particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(particle_surface, (*color, alpha), (size, size), size)
+        particle_surface = to_display_format(particle_surface)
+        # Premultiplied sprites blit through pygame's faster premultiplied path
+        particle_surface = particle_surface.premul_alpha()
+        _PARTICLE_CACHE[key] = particle_surface
+    return particle_surface
+
+
 class Particle:
     """Individual particle with position, velocity, and lifetime"""
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('pos_x', 'pos_y', 'vel_x', 'vel_y', 'color', 'max_lifetime', 'lifetime',
+                 'fade_scale', 'size', 'alpha_bucket')
+    
     def __init__(self, pos: Tuple[float, float] = (0, 0), velocity: Tuple[float, float] = (0, 0),
                  color: Tuple[int, int, int] = (255, 255, 255), lifetime: float = 1.0, size: int = 2):
-        self.pos = list(pos)
-        self.velocity = list(velocity)
-        self.color = color
+        self.pos_x, self.pos_y = pos
+        self.vel_x, self.vel_y = velocity
+        r, g, b = color
+        self.color = (_COLOR_STEPS[r], _COLOR_STEPS[g], _COLOR_STEPS[b])
         self.max_lifetime = lifetime
         self.lifetime = lifetime
+        # Maps remaining lifetime to an alpha bucket
+        self.fade_scale = (PARTICLE_ALPHA_LEVELS - 1) / lifetime
         self.size = size
-        self.alpha = 255
+        self.alpha_bucket = PARTICLE_ALPHA_LEVELS - 1
     
     def reset(self, pos: Tuple[float, float], velocity: Tuple[float, float],
               color: Tuple[int, int, int], lifetime: float, size: int = 2):
         """Reset particle for reuse (object pooling)"""
-        self.pos = list(pos)
-        self.velocity = list(velocity)
-        self.color = color
+        self.pos_x, self.pos_y = pos
+        self.vel_x, self.vel_y = velocity
+        r, g, b = color
+        self.color = (_COLOR_STEPS[r], _COLOR_STEPS[g], _COLOR_STEPS[b])
         self.max_lifetime = lifetime
         self.lifetime = lifetime
+        # Maps remaining lifetime to an alpha bucket
+        self.fade_scale = (PARTICLE_ALPHA_LEVELS - 1) / lifetime
         self.size = size
-        self.alpha = 255
-    
-    def update(self, dt: float):
-        """Update particle position and lifetime"""
-        # Update position
-        self.pos[0] += self.velocity[0] * dt
-        self.pos[1] += self.velocity[1] * dt
-        
-        # Update lifetime
-        self.lifetime -= dt
-        
-        # Update alpha based on remaining lifetime
-        if self.lifetime > 0:
-            self.alpha = int(255 * (self.lifetime / self.max_lifetime))
-        else:
-            self.alpha = 0
-    
-    def draw(self, screen: pygame.Surface):
-        """Draw the particle"""
-        if self.alpha <= 0:
-            return
-        
-        # Create surface for particle with alpha
-        particle_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        # Calculate color with alpha
-        color_with_alpha = (*self.color, self.alpha)
-        
-        # Draw particle as a circle
-        pygame.draw.circle(particle_surface, color_with_alpha, 
-                          (self.size, self.size), self.size)
-        
-        # Draw to screen
-        screen.blit(particle_surface, 
-                   (int(self.pos[0] - self.size), int(self.pos[1] - self.size)))
+        self.alpha_bucket = PARTICLE_ALPHA_LEVELS - 1
 
 
 class ParticleEmitter:
@@ -84,167 +86,218 @@ class ParticleEmitter:
     
     def update(self, dt: float):
         """Update all particles and manage pooling"""
-        # Update existing particles
-        for particle in self.particles[:]:
-            particle.update(dt)
+        # Update in a single pass, compacting survivors into a new list
+        # instead of copying the list and calling list.remove() per death.
+        # Position, lifetime, fade and the cull test are fused into one step,
+        # since this runs for every particle every frame.
+        live_particles = []
+        pool = self.particle_pool
+        max_particles = self.max_particles
+        
+        # Off-screen culling bounds
+        min_x = -config.PARTICLE_CULL_DISTANCE
+        min_y = -config.PARTICLE_CULL_DISTANCE
+        max_x = config.SCREEN_WIDTH + config.PARTICLE_CULL_DISTANCE
+        max_y = config.SCREEN_HEIGHT + config.PARTICLE_CULL_DISTANCE
+        
+        for particle in self.particles:
+            lifetime = particle.lifetime - dt
+            x = particle.pos_x + particle.vel_x * dt
+            y = particle.pos_y + particle.vel_y * dt
             
-            # Check if particle is off-screen for culling
-            if (particle.pos[0] < -config.PARTICLE_CULL_DISTANCE or 
-                particle.pos[0] > config.SCREEN_WIDTH + config.PARTICLE_CULL_DISTANCE or
-                particle.pos[1] < -config.PARTICLE_CULL_DISTANCE or 
-                particle.pos[1] > config.SCREEN_HEIGHT + config.PARTICLE_CULL_DISTANCE):
+            if lifetime > 0 and min_x <= x <= max_x and min_y <= y <= max_y:
+                particle.pos_x = x
+                particle.pos_y = y
+                particle.lifetime = lifetime
+                particle.alpha_bucket = -int(-lifetime * particle.fade_scale)
+                live_particles.append(particle)
+            elif len(pool) < max_particles:
+                # Return dead particles to pool
                 particle.lifetime = 0
-            
-            # Return dead particles to pool
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
-                if len(self.particle_pool) < self.max_particles:
-                    self.particle_pool.append(particle)
+                particle.alpha_bucket = 0
+                pool.append(particle)
+        
+        self.particles = live_particles
     
     def draw(self, screen: pygame.Surface):
         """Draw all active particles (skip if too many for performance)"""
-        # Adaptive quality - skip some particles if too many
-        if config.ADAPTIVE_QUALITY and len(self.particles) > self.max_particles * 0.8:
-            # Draw every other particle when near limit
-            for i, particle in enumerate(self.particles):
-                if i % 2 == 0:
-                    particle.draw(screen)
-        else:
-            # Draw all particles normally
-            for particle in self.particles:
-                particle.draw(screen)
+        # Adaptive quality - draw every other particle when near limit
+        particles = self.particles
+        if config.ADAPTIVE_QUALITY and len(particles) > self.max_particles * 0.8:
+            particles = particles[::2]
+        
+        # Queue every particle and draw them with one blits call, reading the
+        # sprite cache directly
+        sprites = _PARTICLE_CACHE
+        blend = pygame.BLEND_PREMULTIPLIED
+        screen_width, screen_height = screen.get_size()
+        particle_blits = []
+        for particle in particles:
+            alpha_bucket = particle.alpha_bucket
+            if alpha_bucket <= 0:
+                continue
+            
+            # Particles live up to PARTICLE_CULL_DISTANCE off-screen, so skip
+            # the ones that would be clipped away entirely
+            x = particle.pos_x
+            y = particle.pos_y
+            size = particle.size
+            if (x + size <= 0 or x - size >= screen_width or
+                    y + size <= 0 or y - size >= screen_height):
+                continue
+            
+            color = particle.color
+            sprite = sprites.get((color, size, alpha_bucket))
+            if sprite is None:
+                sprite = get_particle_surface(color, size, alpha_bucket)
+            
+            particle_blits.append((sprite, (int(x - size), int(y - size)), None, blend))
+        screen.blits(particle_blits, doreturn=False)
     
     def create_muzzle_flash(self, pos: Tuple[float, float], 
                           direction: float, color: Tuple[int, int, int]):
         """Create muzzle flash effect with pooling and adaptive quality"""
+        # Local bindings for the per-particle loop
+        cos = math.cos
+        sin = math.sin
+        uniform = random.uniform
+        randint = random.randint
+        
         # Reduce particle count if near limit (adaptive quality)
         particle_count = config.MUZZLE_FLASH_PARTICLES
         if config.ADAPTIVE_QUALITY and len(self.particles) > self.max_particles * 0.7:
             particle_count = particle_count // 2
         
+        # Remove oldest particles to make room for the whole flash
+        self._cleanup_excess_particles(particle_count)
+        
         for _ in range(particle_count):
-            # Check if we're at max particles
-            if len(self.particles) >= self.max_particles:
-                # Remove oldest particle to make room
-                if self.particles:
-                    old_particle = self.particles.pop(0)
-                    if len(self.particle_pool) < self.max_particles:
-                        self.particle_pool.append(old_particle)
-            
             # Random angle within cone
-            spread = random.uniform(-0.3, 0.3)
+            spread = uniform(-0.3, 0.3)
             angle = direction + spread
             
+            # Velocity and start offset share the direction, so take the
+            # trig once
+            dir_x = cos(angle)
+            dir_y = sin(angle)
+            
             # Random speed
-            speed = random.uniform(100, 300)
-            velocity = vector_from_angle(angle, speed)
+            speed = uniform(100, 300)
+            velocity = (dir_x * speed, dir_y * speed)
             
             # Add some randomness to starting position
-            offset = vector_from_angle(angle, random.uniform(5, 15))
-            start_pos = (pos[0] + offset[0], pos[1] + offset[1])
+            offset = uniform(5, 15)
+            start_pos = (pos[0] + dir_x * offset, pos[1] + dir_y * offset)
             
             # Random color variation
-            color_variation = random.randint(-30, 30)
+            color_variation = randint(-30, 30)
             particle_color = (
-                clamp(color[0] + color_variation, 0, 255),
-                clamp(color[1] + color_variation, 0, 255),
-                clamp(color[2] + color_variation, 0, 255)
+                max(0, min(color[0] + color_variation, 255)),
+                max(0, min(color[1] + color_variation, 255)),
+                max(0, min(color[2] + color_variation, 255))
             )
             
-            # Try to get particle from pool
-            if self.particle_pool:
-                particle = self.particle_pool.pop()
-                particle.reset(start_pos, velocity, particle_color,
-                             random.uniform(0.05, config.MUZZLE_FLASH_LIFETIME),
-                             random.randint(1, 3))
-            else:
-                particle = Particle(
-                    start_pos, velocity, particle_color,
-                    random.uniform(0.05, config.MUZZLE_FLASH_LIFETIME),
-                    random.randint(1, 3)
-                )
-            
-            self.particles.append(particle)
+            self._spawn_particle(start_pos, velocity, particle_color,
+                                 uniform(0.05, config.MUZZLE_FLASH_LIFETIME),
+                                 randint(1, 3))
     
     def create_blood_splatter(self, pos: Tuple[float, float], 
                             hit_direction: Tuple[float, float]):
         """Create blood splatter effect when entity is hit"""
+        # Local bindings for the per-particle loop
+        cos = math.cos
+        sin = math.sin
+        uniform = random.uniform
+        randint = random.randint
+        
+        # Random direction away from hit
+        base_angle = math.atan2(hit_direction[1], hit_direction[0])
+        
+        # Remove oldest particles to make room for the whole burst
+        self._cleanup_excess_particles(config.BLOOD_PARTICLES)
+        
         for _ in range(config.BLOOD_PARTICLES):
-            # Random direction away from hit
-            base_angle = math.atan2(hit_direction[1], hit_direction[0])
-            angle = base_angle + random.uniform(-1.0, 1.0)
+            angle = base_angle + uniform(-1.0, 1.0)
             
             # Random speed
-            speed = random.uniform(50, 200)
-            velocity = vector_from_angle(angle, speed)
+            speed = uniform(50, 200)
+            velocity = (cos(angle) * speed, sin(angle) * speed)
             
             # Random color (dark red variations)
             color = (
-                random.randint(100, 150),
+                randint(100, 150),
                 0,
-                random.randint(0, 50)
-            )
-            
-            particle = Particle(
-                pos, velocity, color,
-                random.uniform(0.2, config.BLOOD_LIFETIME),
-                random.randint(2, 4)
+                randint(0, 50)
             )
             
-            self.particles.append(particle)
-            self._cleanup_excess_particles()
+            self._spawn_particle(pos, velocity, color,
+                                 uniform(0.2, config.BLOOD_LIFETIME),
+                                 randint(2, 4))
     
     def create_death_explosion(self, pos: Tuple[float, float], 
                              color: Tuple[int, int, int]):
         """Create explosion effect when entity dies"""
+        # Local bindings for the per-particle loop. Every value is scaled
+        # from random.random(), which skips the Python-level argument
+        # handling in uniform() and randint() on the largest burst
+        cos = math.cos
+        sin = math.sin
+        rand = random.random
+        red, green, blue = color
+        lifetime_span = config.DEATH_EXPLOSION_LIFETIME - 0.5
+        
+        # Remove oldest particles to make room for the whole burst
+        self._cleanup_excess_particles(config.DEATH_EXPLOSION_PARTICLES)
+        
         for _ in range(config.DEATH_EXPLOSION_PARTICLES):
             # Random direction in all directions
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 400)
-            velocity = vector_from_angle(angle, speed)
+            angle = rand() * math.tau
+            speed = 100 + 300 * rand()
+            velocity = (cos(angle) * speed, sin(angle) * speed)
             
-            # Random color variation
-            color_variation = random.randint(-50, 50)
+            # Random color variation in [-50, 50]
+            color_variation = int(rand() * 101) - 50
             particle_color = (
-                clamp(color[0] + color_variation, 0, 255),
-                clamp(color[1] + color_variation, 0, 255),
-                clamp(color[2] + color_variation, 0, 255)
+                max(0, min(red + color_variation, 255)),
+                max(0, min(green + color_variation, 255)),
+                max(0, min(blue + color_variation, 255))
             )
             
-            particle = Particle(
-                pos, velocity, particle_color,
-                random.uniform(0.5, config.DEATH_EXPLOSION_LIFETIME),
-                random.randint(3, 6)
-            )
-            
-            self.particles.append(particle)
-            self._cleanup_excess_particles()
+            # Lifetime in [0.5, DEATH_EXPLOSION_LIFETIME], size in [3, 6]
+            self._spawn_particle(pos, velocity, particle_color,
+                                 0.5 + lifetime_span * rand(),
+                                 3 + int(rand() * 4))
     
     def create_impact_sparks(self, pos: Tuple[float, float], 
                            normal: Tuple[float, float]):
         """Create impact sparks when bullet hits wall"""
+        # Local bindings for the per-particle loop
+        cos = math.cos
+        sin = math.sin
+        uniform = random.uniform
+        randint = random.randint
+        
+        # Random direction away from wall normal
+        base_angle = math.atan2(normal[1], normal[0])
+        
+        # Remove oldest particles to make room for the whole burst
+        self._cleanup_excess_particles(config.IMPACT_SPARKS)
+        
         for _ in range(config.IMPACT_SPARKS):
-            # Random direction away from wall normal
-            base_angle = math.atan2(normal[1], normal[0])
-            angle = base_angle + random.uniform(-0.5, 0.5)
-            speed = random.uniform(100, 300)
-            velocity = vector_from_angle(angle, speed)
+            angle = base_angle + uniform(-0.5, 0.5)
+            speed = uniform(100, 300)
+            velocity = (cos(angle) * speed, sin(angle) * speed)
             
             # Bright yellow/white sparks
             color = (
-                random.randint(200, 255),
-                random.randint(200, 255),
-                random.randint(100, 150)
-            )
-            
-            particle = Particle(
-                pos, velocity, color,
-                random.uniform(0.1, config.IMPACT_LIFETIME),
-                random.randint(1, 2)
+                randint(200, 255),
+                randint(200, 255),
+                randint(100, 150)
             )
             
-            self.particles.append(particle)
-            self._cleanup_excess_particles()
+            self._spawn_particle(pos, velocity, color,
+                                 uniform(0.1, config.IMPACT_LIFETIME),
+                                 randint(1, 2))
     
     def create_trail_particle(self, pos: Tuple[float, float], 
                             velocity: Tuple[float, float],
@@ -253,25 +306,33 @@ class ParticleEmitter:
         # Slower, smaller particles for trails
         trail_velocity = (velocity[0] * 0.3, velocity[1] * 0.3)
         
-        particle = Particle(
-            pos, trail_velocity, color,
-            config.BULLET_TRAIL_DURATION,
-            1
-        )
-        
+        self._cleanup_excess_particles(1)
+        self._spawn_particle(pos, trail_velocity, color,
+                             config.BULLET_TRAIL_DURATION, 1)
+    
+    def _spawn_particle(self, pos: Tuple[float, float], velocity: Tuple[float, float],
+                        color: Tuple[int, int, int], lifetime: float, size: int):
+        """Activate a particle, reusing one from the pool when available"""
+        if self.particle_pool:
+            particle = self.particle_pool.pop()
+            particle.reset(pos, velocity, color, lifetime, size)
+        else:
+            particle = Particle(pos, velocity, color, lifetime, size)
         self.particles.append(particle)
-        self._cleanup_excess_particles()
     
-    def _cleanup_excess_particles(self):
-        """Remove oldest particles if over the limit"""
-        while len(self.particles) > self.max_particles:
-            self.particles.pop(0)
+    def _cleanup_excess_particles(self, room: int = 0):
+        """Remove oldest particles if over the limit, leaving room for more"""
+        excess = len(self.particles) + room - self.max_particles
+        if excess > 0:
+            # One slice delete instead of a pop(0) per particle
+            evicted = self.particles[:excess]
+            del self.particles[:excess]
+            
+            # Return evicted particles to the pool
+            pool_space = self.max_particles - len(self.particle_pool)
+            if pool_space > 0:
+                self.particle_pool.extend(evicted[:pool_space])
     
     def clear_all_particles(self):
         """Remove all particles"""
         self.particles.clear()
-
-
-def clamp(value: int, min_val: int, max_val: int) -> int:
-    """Clamp a value between min and max"""
-    return max(min_val, min(value, max_val))
\ No newline at end of file
@@ -8,7 +8,7 @@ import math
 import random
 from typing import Tuple, List, Optional
 from weapon import WeaponManager
-from bullet import Bullet
+from bullet import Bullet, OwnerRegistry
 from particle_system import ParticleEmitter
 from utils import normalize_vector, vector_from_angle, clamp, distance
 import config
@@ -19,6 +19,7 @@ class Player:
     
     def __init__(self, pos: Tuple[float, float]):
         self.id = 'player'  # Unique identifier for bullet ownership
+        self.owner_int_id = OwnerRegistry.register(self.id)  # Compared against bullet.owner_id
         self.pos = list(pos)
         self.velocity = [0.0, 0.0]
         self.radius = config.PLAYER_SIZE // 2
@@ -111,16 +112,20 @@ class Player:
     
     def _handle_input(self):
         """Handle keyboard and mouse input"""
+        # Key state stays a set: pygame keycodes for arrow/function keys are
+        # above 2**30, too sparse for a bitmask or array indexed by keycode
+        keys_pressed = self.keys_pressed
+        
         # Movement input (supports multiple keys simultaneously)
         self.move_direction = [0.0, 0.0]
         
-        if config.KEY_UP in self.keys_pressed:
+        if config.KEY_UP in keys_pressed:
             self.move_direction[1] -= 1
-        if config.KEY_DOWN in self.keys_pressed:
+        if config.KEY_DOWN in keys_pressed:
             self.move_direction[1] += 1
-        if config.KEY_LEFT in self.keys_pressed:
+        if config.KEY_LEFT in keys_pressed:
             self.move_direction[0] -= 1
-        if config.KEY_RIGHT in self.keys_pressed:
+        if config.KEY_RIGHT in keys_pressed:
             self.move_direction[0] += 1
         
         # Normalize movement direction
@@ -130,17 +135,17 @@ class Player:
             self.move_direction[1] /= length
         
         # Weapon switching (check all keys, first one found wins)
-        if config.KEY_WEAPON_1 in self.keys_pressed:
+        if config.KEY_WEAPON_1 in keys_pressed:
             self.weapon_manager.switch_weapon(0)
-        if config.KEY_WEAPON_2 in self.keys_pressed:
+        if config.KEY_WEAPON_2 in keys_pressed:
             self.weapon_manager.switch_weapon(1)
-        if config.KEY_WEAPON_3 in self.keys_pressed:
+        if config.KEY_WEAPON_3 in keys_pressed:
             self.weapon_manager.switch_weapon(2)
-        if config.KEY_WEAPON_4 in self.keys_pressed:
+        if config.KEY_WEAPON_4 in keys_pressed:
             self.weapon_manager.switch_weapon(3)
         
         # Reload (trigger once per key press, not continuously)
-        if config.KEY_RELOAD in self.keys_pressed:
+        if config.KEY_RELOAD in keys_pressed:
             if not self.reload_key_was_pressed:
                 self.weapon_manager.start_reload()
                 self.reload_key_was_pressed = True
@@ -148,7 +153,7 @@ class Player:
             self.reload_key_was_pressed = False
         
         # Dash (trigger once per key press, not continuously)
-        if config.DASH_ENABLED and pygame.K_SPACE in self.keys_pressed:
+        if config.DASH_ENABLED and pygame.K_SPACE in keys_pressed:
             if not self.dash_key_was_pressed and self.dash_cooldown <= 0 and not self.is_dashing:
                 self._start_dash()
                 self.dash_key_was_pressed = True
@@ -15,6 +15,13 @@ def distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
     return math.sqrt(dx * dx + dy * dy)
 
 
+def dist_sq(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
+    """Calculate squared distance between two points (no sqrt, for comparisons)"""
+    dx = pos2[0] - pos1[0]
+    dy = pos2[1] - pos1[1]
+    return dx * dx + dy * dy
+
+
 def angle_to(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
     """Calculate angle from pos1 to pos2 in radians"""
     dx = pos2[0] - pos1[0]
@@ -71,6 +78,36 @@ def line_of_sight(start: Tuple[float, float], end: Tuple[float, float],
     return True
 
 
+def grid_line_of_sight(start_cell: Tuple[int, int], end_cell: Tuple[int, int],
+                       blocked: bytearray, columns: int) -> bool:
+    """Walk the grid cells between two cells with integer Bresenham, stopping at
+    the first blocked cell. The start and end cells themselves are not tested."""
+    x0, y0 = start_cell
+    x1, y1 = end_cell
+    if x0 == x1 and y0 == y1:
+        return True
+    
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    step_x = 1 if x0 < x1 else -1
+    step_y = 1 if y0 < y1 else -1
+    error = dx + dy
+    
+    while True:
+        double_error = 2 * error
+        if double_error >= dy:
+            error += dy
+            x0 += step_x
+        if double_error <= dx:
+            error += dx
+            y0 += step_y
+        
+        if x0 == x1 and y0 == y1:
+            return True
+        if blocked[y0 * columns + x0]:
+            return False
+
+
 def line_intersects_rect(line_start: pygame.math.Vector2, 
                         line_end: pygame.math.Vector2, 
                         rect: pygame.Rect) -> bool:
@@ -114,14 +151,15 @@ def line_intersects_line(p1: pygame.math.Vector2, p2: pygame.math.Vector2,
 def circle_rect_collision(circle_pos: Tuple[float, float], circle_radius: float,
                          rect: pygame.Rect) -> bool:
     """Check if a circle collides with a rectangle"""
-    # Find the closest point on the rectangle to the circle center
-    closest_x = clamp(circle_pos[0], rect.left, rect.right)
-    closest_y = clamp(circle_pos[1], rect.top, rect.bottom)
+    x, y = circle_pos
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
     
-    # Calculate distance from circle center to closest point
-    dist = distance(circle_pos, (closest_x, closest_y))
+    # Offset from the closest point on the rectangle to the circle center
+    dx = x - (left if x < left else right if x > right else x)
+    dy = y - (top if y < top else bottom if y > bottom else y)
     
-    return dist <= circle_radius
+    # Compare squared distance to avoid the sqrt
+    return dx * dx + dy * dy <= circle_radius * circle_radius
 
 
 def predict_intercept(shooter_pos: Tuple[float, float], 
@@ -181,4 +219,11 @@ def lerp(start: float, end: float, t: float) -> float:
 
 def vector_from_angle(angle: float, length: float = 1.0) -> Tuple[float, float]:
     """Create a vector from an angle and length"""
-    return (math.cos(angle) * length, math.sin(angle) * length)
\ No newline at end of file
+    return (math.cos(angle) * length, math.sin(angle) * length)
+
+
+def to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface to the display's pixel format so blits need no conversion"""
+    if pygame.display.get_surface() is None:
+        return surface  # No display yet (headless tests)
+    return surface.convert_alpha() if alpha else surface.convert()
\ No newline at end of file
@@ -40,6 +40,15 @@ class Weapon:
         self.shots_fired = 0
         self.total_shots_fired = 0
     
+    def reset(self):
+        """Reset ammo, timers and statistics for reuse (object pooling)"""
+        self.ammo = self.magazine_size
+        self.is_reloading = False
+        self.reload_timer = 0.0
+        self.fire_timer = 0.0
+        self.shots_fired = 0
+        self.total_shots_fired = 0
+    
     def can_fire(self) -> bool:
         """Check if weapon can fire"""
         return (not self.is_reloading and 